@@ -2,9 +2,13 @@
 Redis configuration and connection management
 """
 
+import asyncio
+import base64
+import gzip
+import hashlib
 import redis.asyncio as aioredis
 import structlog
-from typing import Optional
+from typing import Optional, Set, Union
 
 from app.core.config import settings
 
@@ -13,6 +17,13 @@ logger = structlog.get_logger()
 # Global Redis connection
 redis_client: Optional[aioredis.Redis] = None
 
+# Cache writes scheduled off the request path
+_background_writes: Set[asyncio.Task] = set()
+
+# Marks gzipped values; the client decodes responses as UTF-8, so the
+# compressed bytes are stored base64 encoded
+_COMPRESSED_PREFIX = "gz:"
+
 
 async def init_redis():
     """Initialize Redis connection"""
@@ -22,7 +33,7 @@ async def init_redis():
             settings.REDIS_URL,
             encoding="utf-8",
             decode_responses=True,
-            max_connections=20,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
             retry_on_timeout=True,
         )
         
@@ -35,7 +46,7 @@ async def init_redis():
 
 
 async def get_redis() -> aioredis.Redis:
-    """Get Redis client instance"""
+    """Get the shared Redis client, whose connection pool lives for the whole process"""
     if redis_client is None:
         await init_redis()
     return redis_client
@@ -50,6 +61,31 @@ async def close_redis():
         logger.info("Redis connection closed")
 
 
+async def flush_background_writes():
+    """Wait for scheduled cache writes to finish"""
+    if _background_writes:
+        await asyncio.gather(*_background_writes, return_exceptions=True)
+
+
+def hash_text(text: str) -> str:
+    """Stable content digest for cache keys (unlike hash(), identical across processes)"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def compress_value(payload: bytes) -> Union[str, bytes]:
+    """Gzip a cache payload above CACHE_COMPRESSION_MIN_BYTES, leaving small ones as is"""
+    if len(payload) <= settings.CACHE_COMPRESSION_MIN_BYTES:
+        return payload
+    return _COMPRESSED_PREFIX + base64.b64encode(gzip.compress(payload)).decode("ascii")
+
+
+def decompress_value(value: Union[str, bytes]) -> Union[str, bytes]:
+    """Reverse compress_value for a value read back from the cache"""
+    if isinstance(value, str) and value.startswith(_COMPRESSED_PREFIX):
+        return gzip.decompress(base64.b64decode(value[len(_COMPRESSED_PREFIX):]))
+    return value
+
+
 class CacheService:
     """Redis cache service with common operations"""
     
@@ -64,7 +100,7 @@ class CacheService:
             logger.error("Cache get error", key=key, error=str(e))
             return None
     
-    async def set(self, key: str, value: str, ttl: int = None) -> bool:
+    async def set(self, key: str, value: Union[str, bytes], ttl: int = None) -> bool:
         """Set value in cache with optional TTL"""
         try:
             if ttl:
@@ -75,6 +111,17 @@ class CacheService:
             logger.error("Cache set error", key=key, error=str(e))
             return False
     
+    def set_in_background(self, key: str, value: Union[str, bytes], ttl: int = None):
+        """Schedule a cache set without waiting for Redis to acknowledge it"""
+        # Bound pending writes so a slow Redis cannot pile up tasks
+        if len(_background_writes) >= settings.CACHE_MAX_BACKGROUND_WRITES:
+            logger.warning("Too many pending cache writes, skipping", key=key)
+            return
+        
+        task = asyncio.create_task(self.set(key, value, ttl))
+        _background_writes.add(task)
+        task.add_done_callback(_background_writes.discard)
+    
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
@@ -75,8 +75,8 @@ class InputRepository:
         input_id: int,
         status: str,
         current_phase: Optional[str] = None
-    ) -> bool:
-        """Update input record status"""
+    ) -> Optional[InputRecord]:
+        """Update input record status and return the updated record"""
         try:
             update_data = {"status": status, "updated_at": datetime.utcnow()}
             if current_phase:
@@ -84,18 +84,21 @@ class InputRepository:
             if status == "completed":
                 update_data["processed_at"] = datetime.utcnow()
             
-            await self.db.execute(
+            # RETURNING hands back the updated row so callers need no re-fetch
+            result = await self.db.execute(
                 update(InputRecord)
                 .where(InputRecord.id == input_id)
                 .values(**update_data)
+                .returning(InputRecord)
             )
+            input_record = result.scalar_one_or_none()
             await self.db.commit()
             
             logger.info("Input record status updated", 
                        input_id=input_id, 
                        status=status, 
                        phase=current_phase)
-            return True
+            return input_record
             
         except Exception as e:
             await self.db.rollback()
@@ -3,6 +3,7 @@ Processing status repository for database operations
 """
 
 import structlog
+from itertools import groupby
 from typing import Optional, Dict, Any, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
@@ -137,6 +138,68 @@ class StatusRepository:
                         error=str(e))
             raise DatabaseError(f"Failed to update processing status: {str(e)}")
     
+    async def update_many(
+        self,
+        input_id: int,
+        updates: List[Dict[str, Any]]
+    ) -> bool:
+        """Apply status updates for several phases of an input record in one transaction"""
+        if not updates:
+            return True
+        
+        try:
+            result = await self.db.execute(
+                select(ProcessingStatus)
+                .where(ProcessingStatus.input_record_id == input_id)
+                .where(ProcessingStatus.phase.in_([
+                    status_update["phase"].value for status_update in updates
+                ]))
+            )
+            existing = {status.phase: status for status in result.scalars().all()}
+            now = datetime.now(timezone.utc)
+            
+            for status_update in updates:
+                phase = status_update["phase"]
+                status = status_update["status"]
+                
+                processing_status = existing.get(phase.value)
+                if processing_status is None:
+                    processing_status = ProcessingStatus(
+                        input_record_id=input_id,
+                        phase=phase.value,
+                        started_at=status_update.get("started_at") or now
+                    )
+                    self.db.add(processing_status)
+                
+                processing_status.status = status.value
+                processing_status.progress_percentage = status_update["progress_percentage"]
+                
+                if status_update.get("phase_data"):
+                    processing_status.phase_data = status_update["phase_data"]
+                if status_update.get("error_message"):
+                    processing_status.error_message = status_update["error_message"]
+                if status_update.get("error_details"):
+                    processing_status.error_details = status_update["error_details"]
+                if status == ProcessingStatusEnum.COMPLETED:
+                    processing_status.completed_at = now
+                    if processing_status.started_at:
+                        duration = (now - processing_status.started_at).total_seconds()
+                        processing_status.duration_seconds = int(duration)
+            
+            await self.db.commit()
+            
+            logger.info("Processing statuses updated", 
+                       input_id=input_id, 
+                       phases=[status_update["phase"].value for status_update in updates])
+            return True
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error("Failed to update processing statuses", 
+                        input_id=input_id, 
+                        error=str(e))
+            raise DatabaseError(f"Failed to update processing statuses: {str(e)}")
+    
     async def get_latest_status(self, input_id: int) -> Optional[ProcessingStatusResponse]:
         """Get the latest processing status for an input record"""
         try:
@@ -181,6 +244,31 @@ class StatusRepository:
             logger.error("Failed to get processing statuses", input_id=input_id, error=str(e))
             raise DatabaseError(f"Failed to get processing statuses: {str(e)}")
     
+    async def get_all_statuses_for_inputs(
+        self, 
+        input_ids: List[int]
+    ) -> Dict[int, List[ProcessingStatus]]:
+        """Get all processing statuses for several input records in a single query"""
+        if not input_ids:
+            return {}
+        
+        try:
+            result = await self.db.execute(
+                select(ProcessingStatus)
+                .where(ProcessingStatus.input_record_id.in_(input_ids))
+                .order_by(ProcessingStatus.input_record_id, ProcessingStatus.created_at.asc())
+            )
+            return {
+                input_id: list(statuses)
+                for input_id, statuses in groupby(
+                    result.scalars().all(), key=lambda status: status.input_record_id
+                )
+            }
+            
+        except Exception as e:
+            logger.error("Failed to get processing statuses", input_ids=input_ids, error=str(e))
+            raise DatabaseError(f"Failed to get processing statuses: {str(e)}")
+    
     async def get_status_by_phase(
         self, 
         input_id: int, 
@@ -2,24 +2,46 @@
 Language detection service using langdetect + langid as primary with Google Translate API fallback
 """
 
+import re
 import structlog
 from typing import Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as aioredis
 from langdetect import detect, DetectorFactory, LangDetectException
 import langid
-import requests
+import orjson
+from prometheus_client import Counter
 
 from app.core.config import settings
 from app.core.exceptions import LanguageDetectionError
 from app.schemas.input_processing import LanguageDetectionResult
-from app.core.redis import CacheService
+from app.core.redis import CacheService, hash_text
+from app.services.translation.providers import get_http_client
 
 logger = structlog.get_logger()
 
+# Prometheus metrics
+LANGUAGE_DETECTION_ASCII_SHORTCUTS = Counter(
+    'language_detection_ascii_shortcuts_total',
+    'Pure-ASCII inputs langid classified as English, skipping full detection'
+)
+
 # Set seed for consistent results
 DetectorFactory.seed = 0
 
+# Patterns stripped before detection
+_URL_RE = re.compile(r'https?://[^\s]+')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_BANG_RE = re.compile(r'[!]{3,}')
+_QUESTION_RE = re.compile(r'[?]{3,}')
+
+
+def warm_up_language_detection():
+    """Load the langid model and langdetect profiles, which otherwise load on the first request"""
+    langid.classify("Warm up the language detection models")
+    detect("Warm up the language detection models")
+    logger.info("Language detection models loaded")
+
 
 class LanguageDetectionService:
     """Service for detecting language of input text"""
@@ -39,13 +61,30 @@ class LanguageDetectionService:
         """
         logger.info("Starting language detection", text_length=len(text))
         
+        # Romanized Hindi and other Indic text is ASCII too, so only a cheap
+        # langid classification of "en" lets longer ASCII text skip detection
+        if (
+            settings.LANGUAGE_DETECTION_ASCII_SHORTCUT and
+            len(text) > settings.LANGUAGE_DETECTION_ASCII_MIN_LENGTH and
+            text.isascii() and
+            langid.classify(text)[0] == "en"
+        ):
+            logger.info("ASCII input classified as English, skipping detection")
+            LANGUAGE_DETECTION_ASCII_SHORTCUTS.inc()
+            return LanguageDetectionResult(
+                language="en",
+                confidence=0.99,
+                is_reliable=True,
+                alternative_languages=[]
+            )
+        
         # Check cache first
-        cache_key = f"lang_detect:{hash(text)}"
+        cache_key = f"lang_detect:{hash_text(text)}"
         cached_result = await self.cache_service.get(cache_key)
         
         if cached_result:
             logger.info("Language detection result found in cache")
-            return LanguageDetectionResult.parse_raw(cached_result)
+            return LanguageDetectionResult.model_validate(orjson.loads(cached_result))
         
         # Try primary detection method (langdetect)
         try:
@@ -56,9 +95,9 @@ class LanguageDetectionService:
                            confidence=result.confidence)
                 
                 # Cache the result
-                await self.cache_service.set(
+                self.cache_service.set_in_background(
                     cache_key, 
-                    result.json(), 
+                    orjson.dumps(result.model_dump()), 
                     settings.CACHE_TTL_LANGUAGE_DETECTION
                 )
                 
@@ -79,9 +118,9 @@ class LanguageDetectionService:
                            confidence=result.confidence)
                 
                 # Cache the result
-                await self.cache_service.set(
+                self.cache_service.set_in_background(
                     cache_key, 
-                    result.json(), 
+                    orjson.dumps(result.model_dump()), 
                     settings.CACHE_TTL_LANGUAGE_DETECTION
                 )
                 
@@ -98,9 +137,9 @@ class LanguageDetectionService:
                            confidence=result.confidence)
                 
                 # Cache the result
-                await self.cache_service.set(
+                self.cache_service.set_in_background(
                     cache_key, 
-                    result.json(), 
+                    orjson.dumps(result.model_dump()), 
                     settings.CACHE_TTL_LANGUAGE_DETECTION
                 )
                 
@@ -209,10 +248,10 @@ class LanguageDetectionService:
                 'q': cleaned_text
             }
             
-            response = requests.post(self.google_base_url, params=params, timeout=30)
+            response = await get_http_client().post(self.google_base_url, params=params)
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             
             if 'data' not in result or 'detections' not in result['data']:
                 raise LanguageDetectionError("Invalid API response format")
@@ -247,13 +286,12 @@ class LanguageDetectionService:
         cleaned = ' '.join(text.split())
         
         # Remove URLs and email addresses
-        import re
-        cleaned = re.sub(r'https?://[^\s]+', '', cleaned)
-        cleaned = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', cleaned)
+        cleaned = _URL_RE.sub('', cleaned)
+        cleaned = _EMAIL_RE.sub('', cleaned)
         
         # Remove excessive punctuation
-        cleaned = re.sub(r'[!]{3,}', '!', cleaned)
-        cleaned = re.sub(r'[?]{3,}', '?', cleaned)
+        cleaned = _BANG_RE.sub('!', cleaned)
+        cleaned = _QUESTION_RE.sub('?', cleaned)
         
         return cleaned.strip()
     
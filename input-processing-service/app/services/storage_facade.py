@@ -3,7 +3,9 @@ Storage facade to maintain compatibility when replacing the monolith InputStorag
 """
 
 import structlog
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Union
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as aioredis
 
@@ -26,6 +28,71 @@ from app.services.cache.cache_manager import CacheManager
 logger = structlog.get_logger()
 
 
+def _to_json_data(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Dump result models in a status payload to JSON-compatible data, only when it is written"""
+    if not data:
+        return data
+    return {
+        key: value.model_dump(mode="json") if isinstance(value, BaseModel) else value
+        for key, value in data.items()
+    }
+
+
+class StorageBatch:
+    """Collects processing status updates for one input record and writes them in a single transaction"""
+    
+    def __init__(self, storage_service: "InputStorageService", input_id: int):
+        self.storage_service = storage_service
+        self.input_id = input_id
+        self._updates: Dict[ProcessingPhase, Dict[str, Any]] = {}
+    
+    def update_processing_status(
+        self,
+        phase: ProcessingPhase,
+        status: ProcessingStatusEnum,
+        progress_percentage: int = 0,
+        phase_data: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        error_details: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Record a status update, superseding any earlier update for the same phase
+        phase_data and error_details may hold result models; only the ones that are written get dumped
+        """
+        previous = self._updates.get(phase, {})
+        self._updates[phase] = {
+            "phase": phase,
+            "status": status,
+            "progress_percentage": progress_percentage,
+            "phase_data": phase_data or previous.get("phase_data"),
+            "error_message": error_message or previous.get("error_message"),
+            "error_details": error_details or previous.get("error_details"),
+            # Keep when the phase was first reported so durations stay accurate
+            "started_at": previous.get("started_at") or datetime.now(timezone.utc)
+        }
+    
+    async def flush(self) -> bool:
+        """Write the collected updates"""
+        updates = list(self._updates.values())
+        self._updates.clear()
+        return await self.storage_service.update_processing_statuses(self.input_id, updates)
+    
+    async def __aenter__(self) -> "StorageBatch":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self.flush()
+        except Exception as e:
+            # Don't mask the error that ended the batch
+            if exc_type is None:
+                raise
+            logger.error("Failed to flush processing status updates", 
+                        input_id=self.input_id, 
+                        error=str(e))
+        return False
+
+
 class InputStorageService:
     """Facade that maintains the original InputStorageService API while using new repository architecture"""
     
@@ -92,17 +159,17 @@ class InputStorageService:
         """Update input record status - maintains original API"""
         try:
             # Use repository for update
-            result = await self.input_repo.update_status(
+            input_record = await self.input_repo.update_status(
                 input_id=input_id,
                 status=status,
                 current_phase=current_phase
             )
             
-            # Update cache if successful
-            if result:
-                await self.cache_manager.invalidate_input_record(input_id)
+            # Write-through: refresh the cache with the updated record so the next read hits
+            if input_record:
+                await self.cache_manager.cache_input_record(input_id, input_record)
             
-            return result
+            return input_record is not None
             
         except Exception as e:
             logger.error("Failed to update input record status", 
@@ -160,9 +227,9 @@ class InputStorageService:
                 phase=phase,
                 status=status,
                 progress_percentage=progress_percentage,
-                phase_data=phase_data,
+                phase_data=_to_json_data(phase_data),
                 error_message=error_message,
-                error_details=error_details
+                error_details=_to_json_data(error_details)
             )
             
             # Update cache if successful
@@ -178,6 +245,42 @@ class InputStorageService:
                         error=str(e))
             raise DatabaseError(f"Failed to update processing status: {str(e)}")
     
+    async def update_processing_statuses(
+        self,
+        input_id: int,
+        updates: List[Dict[str, Any]]
+    ) -> bool:
+        """Update processing status for several phases in one transaction"""
+        if not updates:
+            return True
+        
+        try:
+            updates = [
+                {
+                    **status_update,
+                    "phase_data": _to_json_data(status_update.get("phase_data")),
+                    "error_details": _to_json_data(status_update.get("error_details"))
+                }
+                for status_update in updates
+            ]
+            result = await self.status_repo.update_many(input_id, updates)
+            
+            # Update cache if successful
+            if result:
+                await self.cache_manager.invalidate_status_summary(input_id)
+            
+            return result
+            
+        except Exception as e:
+            logger.error("Failed to update processing statuses", 
+                        input_id=input_id, 
+                        error=str(e))
+            raise DatabaseError(f"Failed to update processing statuses: {str(e)}")
+    
+    def batch(self, input_id: int) -> StorageBatch:
+        """Collect processing status updates for an input and write them once on exit"""
+        return StorageBatch(self, input_id)
+    
     async def get_processing_status(self, input_id: int) -> Optional[ProcessingStatusResponse]:
         """Get processing status for a specific input record - maintains original API"""
         try:
@@ -216,34 +319,7 @@ class InputStorageService:
             if not all_statuses:
                 return None
             
-            # Build phases list from all records
-            phases = []
-            latest_status = all_statuses[-1]
-            
-            for status in all_statuses:
-                phases.append(ProcessingPhaseStatus(
-                    phase=status.phase,
-                    status=status.status,
-                    progress_percentage=status.progress_percentage,
-                    started_at=status.started_at,
-                    completed_at=status.completed_at,
-                    duration_seconds=status.duration_seconds,
-                    phase_data=status.phase_data if status.phase_data else None,
-                    error_message=status.error_message,
-                    error_details=status.error_details
-                ))
-            
-            # Build complete response
-            response = ProcessingStatusResponse(
-                input_id=input_id,
-                status=latest_status.status,
-                current_phase=latest_status.phase,
-                progress_percentage=latest_status.progress_percentage,
-                phases=phases,
-                created_at=all_statuses[0].created_at,
-                updated_at=latest_status.created_at,
-                processed_at=latest_status.completed_at
-            )
+            response = self._build_complete_status_response(input_id, all_statuses)
             
             # Cache the complete result
             await self.cache_manager.cache_status_summary(input_id, response.dict())
@@ -254,6 +330,58 @@ class InputStorageService:
             logger.error("Failed to get complete processing status", input_id=input_id, error=str(e))
             raise DatabaseError(f"Failed to get complete processing status: {str(e)}")
     
+    async def get_complete_processing_status_bulk(
+        self, 
+        input_ids: List[int]
+    ) -> Dict[int, ProcessingStatusResponse]:
+        """Get complete processing status for several inputs with one database round trip"""
+        try:
+            statuses_by_input = await self.status_repo.get_all_statuses_for_inputs(input_ids)
+            
+            return {
+                input_id: self._build_complete_status_response(input_id, all_statuses)
+                for input_id, all_statuses in statuses_by_input.items()
+            }
+            
+        except Exception as e:
+            logger.error("Failed to get complete processing statuses", input_ids=input_ids, error=str(e))
+            raise DatabaseError(f"Failed to get complete processing statuses: {str(e)}")
+    
+    def _build_complete_status_response(
+        self, 
+        input_id: int, 
+        all_statuses: List[ProcessingStatus]
+    ) -> ProcessingStatusResponse:
+        """Build a complete status response from status records ordered by creation time"""
+        # Build phases list from all records
+        phases = []
+        latest_status = all_statuses[-1]
+        
+        for status in all_statuses:
+            phases.append(ProcessingPhaseStatus(
+                phase=status.phase,
+                status=status.status,
+                progress_percentage=status.progress_percentage,
+                started_at=status.started_at,
+                completed_at=status.completed_at,
+                duration_seconds=status.duration_seconds,
+                phase_data=status.phase_data if status.phase_data else None,
+                error_message=status.error_message,
+                error_details=status.error_details
+            ))
+        
+        # Build complete response
+        return ProcessingStatusResponse(
+            input_id=input_id,
+            status=latest_status.status,
+            current_phase=latest_status.phase,
+            progress_percentage=latest_status.progress_percentage,
+            phases=phases,
+            created_at=all_statuses[0].created_at,
+            updated_at=latest_status.created_at,
+            processed_at=latest_status.completed_at
+        )
+    
     async def update_language_detection_results(
         self,
         input_id: int,
@@ -283,10 +411,13 @@ class InputStorageService:
     async def update_translation_results(
         self,
         input_id: int,
-        translation_result: dict
+        translation_result: Union[dict, BaseModel]
     ) -> bool:
         """Update translation results - maintains original API"""
         try:
+            if isinstance(translation_result, BaseModel):
+                translation_result = translation_result.model_dump(mode="json")
+            
             result = await self.input_repo.update_translation_result(
                 input_id=input_id,
                 translation_result=translation_result
@@ -2,18 +2,158 @@
 Text preprocessing service for cleaning, normalization, and formatting
 """
 
+import asyncio
+import orjson
+import os
 import re
 import structlog
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as aioredis
 import unicodedata
 
 from app.core.config import settings
+from app.core.redis import CacheService, hash_text
 from app.schemas.input_processing import PreprocessingResult
 
 logger = structlog.get_logger()
 
+# Characters kept by special character removal (non-ASCII is always kept)
+_ALLOWED_CHAR_RE = re.compile(r'[\w\s\.\,\!\?\;\:\-\(\)\[\]\{\}\"\'\/\\]')
+
+# ASCII characters that the normalization steps would strip or rewrite:
+# control characters and symbols outside the allowed set
+_NEEDS_WORK_CHARS = frozenset(
+    char for char in map(chr, range(128))
+    if unicodedata.category(char) == 'Cc' or not _ALLOWED_CHAR_RE.match(char)
+)
+
+# Repeated punctuation collapsed by punctuation normalization
+_MULTI_PUNCT_RE = re.compile(r'([!?.,])\1')
+
+# Unicode categories stripped during normalization:
+# control characters, format characters, private use, unassigned
+_STRIPPED_CATEGORIES = frozenset(['Cc', 'Cf', 'Co', 'Cn'])
+
+
+@lru_cache(maxsize=4096)
+def _is_stripped(codepoint: int) -> bool:
+    """Whether Unicode normalization strips a code point (bounded, user input picks the code points)"""
+    return unicodedata.category(chr(codepoint)) in _STRIPPED_CATEGORIES
+
+
+class _UnicodeStripTable(dict):
+    """str.translate table that classifies code points outside its fixed entries on lookup"""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        return None if _is_stripped(codepoint) else codepoint
+
+
+# Also folds typographic quotes and dashes to ASCII in the same pass
+_UNICODE_STRIP_TABLE = _UnicodeStripTable({
+    ord('\u201C'): '"',
+    ord('\u201D'): '"',
+    ord('\u2018'): "'",
+    ord('\u2019'): "'",
+    ord('\u2013'): '-',
+    ord('\u2014'): '-'
+})
+
+# str.translate table deleting ASCII characters outside the allowed set
+_SPECIAL_CHARS_TABLE = {
+    ord(char): None for char in map(chr, range(128)) if not _ALLOWED_CHAR_RE.match(char)
+}
+
+_SPACES_RE = re.compile(r' +')
+_NEWLINES_RE = re.compile(r'\n+')
+_REPEATED_PUNCT_RE = re.compile(r'([!?.,])\1+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Common typos, matched case-insensitively as whole words in a single pass
+_TYPO_CORRECTIONS = {
+    'teh': 'the',
+    'adn': 'and',
+    'yuo': 'you',
+    'thier': 'their',
+    'there': 'there',  # Context-dependent, simplified
+    'seperate': 'separate',
+    'occured': 'occurred',
+    'recieve': 'receive',
+    'acheive': 'achieve',
+    'definately': 'definitely'
+}
+_TYPO_RE = re.compile(r'\b(' + '|'.join(_TYPO_CORRECTIONS) + r')\b', re.IGNORECASE)
+
+# Process pool for the CPU-bound preprocessing steps, shared by all service instances
+_executor: Optional[ProcessPoolExecutor] = None
+
+_T = TypeVar("_T")
+
+
+def _preprocessing_workers() -> int:
+    """Number of preprocessing worker processes"""
+    return settings.PREPROCESSING_WORKERS or os.cpu_count()
+
+
+def get_preprocessing_executor() -> ProcessPoolExecutor:
+    """Get the preprocessing process pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        max_workers = _preprocessing_workers()
+        _executor = ProcessPoolExecutor(max_workers=max_workers)
+        logger.info("Preprocessing process pool started", max_workers=max_workers)
+    return _executor
+
+
+async def warm_up_preprocessing_executor():
+    """Start every worker process and run the pipeline once in each before the first request"""
+    executor = get_preprocessing_executor()
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(executor, _preprocess_sync, "Warm up the “pipeline” – once.")
+        for _ in range(_preprocessing_workers())
+    ))
+    logger.info("Preprocessing process pool warmed up")
+
+
+def shutdown_preprocessing_executor():
+    """Shut down the preprocessing process pool"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        logger.info("Preprocessing process pool stopped")
+
+
+async def _run_preprocessing(fn: Callable[[Any], _T], arg: Any, text_length: int) -> _T:
+    """
+    Run a preprocessing entry point inline for short text, in the process pool otherwise
+    Short text is cheaper to process than to ship to a worker and back
+    """
+    if text_length <= settings.PREPROCESSING_INLINE_MAX_LENGTH:
+        return fn(arg)
+    
+    global _executor
+    loop = asyncio.get_running_loop()
+    executor = get_preprocessing_executor()
+    try:
+        return await loop.run_in_executor(executor, fn, arg)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); replace the pool unless another call already did
+        logger.warning("Preprocessing process pool broken, restarting it")
+        if _executor is executor:
+            _executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(get_preprocessing_executor(), fn, arg)
+
+
+def _preprocess_sync(text: str) -> PreprocessingResult:
+    """Module-level entry point so worker processes can unpickle the call"""
+    return TextPreprocessingService._run_pipeline(text)
+
 
 class TextPreprocessingService:
     """Service for preprocessing text before scene analysis"""
@@ -21,83 +161,143 @@ class TextPreprocessingService:
     def __init__(self, db: AsyncSession, redis: aioredis.Redis):
         self.db = db
         self.redis = redis
+        self.cache_service = CacheService(redis)
     
     async def preprocess_text(self, text: str) -> PreprocessingResult:
         """
         Preprocess text for better scene analysis
+        Runs the CPU-bound steps for longer text in the shared process pool to keep the event loop responsive
         """
         logger.info("Starting text preprocessing", text_length=len(text))
         
-        original_text = text
-        processed_text = text
-        preprocessing_steps = []
-        metadata = {}
+        # Check cache first
+        cached_result = await self.get_cached_result(text)
+        if cached_result is not None:
+            return cached_result
         
-        # Step 1: Normalize Unicode
-        processed_text, unicode_info = self._normalize_unicode(processed_text)
-        preprocessing_steps.append("unicode_normalization")
-        metadata["unicode_info"] = unicode_info
+        result = await _run_preprocessing(_preprocess_sync, text, len(text))
         
-        # Step 2: Clean whitespace
-        processed_text, whitespace_info = self._clean_whitespace(processed_text)
-        preprocessing_steps.append("whitespace_cleaning")
-        metadata["whitespace_info"] = whitespace_info
+        logger.info("Text preprocessing completed", 
+                   original_length=len(result.original_text),
+                   processed_length=len(result.processed_text),
+                   steps_count=len(result.preprocessing_steps))
+        
+        # Cache the result
+        self.cache_service.set_in_background(
+            f"preprocessing:{hash_text(text)}", 
+            orjson.dumps(result.model_dump()), 
+            settings.CACHE_TTL_PREPROCESSING
+        )
         
-        # Step 3: Remove special characters
-        processed_text, special_chars_info = self._remove_special_characters(processed_text)
-        preprocessing_steps.append("special_characters_removal")
-        metadata["special_chars_info"] = special_chars_info
+        return result
+    
+    async def get_cached_result(self, text: str) -> Optional[PreprocessingResult]:
+        """Look up the cached result of fully preprocessing text"""
+        cached_result = await self.cache_service.get(f"preprocessing:{hash_text(text)}")
+        
+        if cached_result:
+            logger.info("Preprocessing result found in cache")
+            return PreprocessingResult.model_validate(orjson.loads(cached_result))
+        return None
+    
+    @classmethod
+    def _run_pipeline(cls, text: str) -> PreprocessingResult:
+        """Run all preprocessing steps synchronously"""
+        return cls._run_english_steps(cls._run_language_agnostic_steps(text))
+    
+    @classmethod
+    def _run_language_agnostic_steps(cls, text: str) -> PreprocessingResult:
+        """Run the normalization steps that are safe for text in any language"""
+        processed_text = text
+        preprocessing_steps = []
+        metadata = {}
         
-        # Step 4: Normalize punctuation
-        processed_text, punctuation_info = self._normalize_punctuation(processed_text)
-        preprocessing_steps.append("punctuation_normalization")
-        metadata["punctuation_info"] = punctuation_info
+        if cls._is_clean_ascii(processed_text):
+            # Steps 1-4 are no-ops on clean ASCII; whitespace is collapsed by final cleanup
+            preprocessing_steps.append("fast_path")
+        else:
+            # Step 1: Normalize Unicode
+            processed_text, unicode_info = cls._normalize_unicode(processed_text)
+            preprocessing_steps.append("unicode_normalization")
+            metadata["unicode_info"] = unicode_info
+            
+            # Step 2: Clean whitespace
+            processed_text, whitespace_info = cls._clean_whitespace(processed_text)
+            preprocessing_steps.append("whitespace_cleaning")
+            metadata["whitespace_info"] = whitespace_info
+            
+            # Step 3: Remove special characters
+            processed_text, special_chars_info = cls._remove_special_characters(processed_text)
+            preprocessing_steps.append("special_characters_removal")
+            metadata["special_chars_info"] = special_chars_info
+            
+            # Step 4: Normalize punctuation
+            processed_text, punctuation_info = cls._normalize_punctuation(processed_text)
+            preprocessing_steps.append("punctuation_normalization")
+            metadata["punctuation_info"] = punctuation_info
+        
+        return PreprocessingResult(
+            original_text=text,
+            processed_text=processed_text,
+            preprocessing_steps=preprocessing_steps,
+            metadata=metadata
+        )
+    
+    @classmethod
+    def _run_english_steps(cls, partial_result: PreprocessingResult) -> PreprocessingResult:
+        """Run the English-specific steps on the output of the language-agnostic steps"""
+        processed_text = partial_result.processed_text
+        preprocessing_steps = list(partial_result.preprocessing_steps)
+        metadata = dict(partial_result.metadata)
         
         # Step 5: Fix common typos
-        processed_text, typo_info = self._fix_common_typos(processed_text)
+        processed_text, typo_info = cls._fix_common_typos(processed_text)
         preprocessing_steps.append("typo_correction")
         metadata["typo_info"] = typo_info
         
         # Step 6: Sentence segmentation
-        processed_text, segmentation_info = self._segment_sentences(processed_text)
+        processed_text, segmentation_info = cls._segment_sentences(processed_text)
         preprocessing_steps.append("sentence_segmentation")
         metadata["segmentation_info"] = segmentation_info
         
         # Step 7: Final cleanup
-        processed_text = self._final_cleanup(processed_text)
+        processed_text = cls._final_cleanup(processed_text)
         preprocessing_steps.append("final_cleanup")
         
         result = PreprocessingResult(
-            original_text=original_text,
+            original_text=partial_result.original_text,
             processed_text=processed_text,
             preprocessing_steps=preprocessing_steps,
             metadata=metadata
         )
         
-        logger.info("Text preprocessing completed", 
-                   original_length=len(original_text),
-                   processed_length=len(processed_text),
-                   steps_count=len(preprocessing_steps))
-        
         return result
     
-    def _normalize_unicode(self, text: str) -> tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _is_clean_ascii(text: str) -> bool:
+        """Check whether text would pass unchanged through the normalization steps"""
+        return (
+            text.isascii()
+            and _NEEDS_WORK_CHARS.isdisjoint(text)
+            and _MULTI_PUNCT_RE.search(text) is None
+        )
+    
+    @staticmethod
+    def _normalize_unicode(text: str) -> tuple[str, Dict[str, Any]]:
         """Normalize Unicode characters"""
         original_length = len(text)
         
         # Normalize to NFC (Canonical Decomposition, followed by Canonical Composition)
         normalized_text = unicodedata.normalize('NFC', text)
         
-        # Remove or replace problematic Unicode characters
-        cleaned_text = ""
+        # Remove problematic Unicode characters and fold quotes/dashes in a single C-level pass
+        cleaned_text = normalized_text.translate(_UNICODE_STRIP_TABLE)
         removed_chars = []
-        
-        for char in normalized_text:
-            if unicodedata.category(char) in ['Cc', 'Cf', 'Co', 'Cn']:
-                # Control characters, format characters, private use, unassigned
-                removed_chars.append(char)
-            else:
-                cleaned_text += char
+        if len(cleaned_text) != len(normalized_text):
+            removed_chars = [
+                char for char in normalized_text
+                if _UNICODE_STRIP_TABLE[ord(char)] is None
+            ]
         
         info = {
             "original_length": original_length,
@@ -108,15 +308,16 @@ class TextPreprocessingService:
         
         return cleaned_text, info
     
-    def _clean_whitespace(self, text: str) -> tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _clean_whitespace(text: str) -> tuple[str, Dict[str, Any]]:
         """Clean and normalize whitespace"""
         original_length = len(text)
         
         # Replace multiple spaces with single space
-        cleaned_text = re.sub(r' +', ' ', text)
+        cleaned_text = _SPACES_RE.sub(' ', text)
         
         # Replace multiple newlines with single newline
-        cleaned_text = re.sub(r'\n+', '\n', cleaned_text)
+        cleaned_text = _NEWLINES_RE.sub('\n', cleaned_text)
         
         # Replace tabs with spaces
         cleaned_text = cleaned_text.replace('\t', ' ')
@@ -133,21 +334,17 @@ class TextPreprocessingService:
         
         return cleaned_text, info
     
-    def _remove_special_characters(self, text: str) -> tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _remove_special_characters(text: str) -> tuple[str, Dict[str, Any]]:
         """Remove or replace special characters while preserving Unicode text"""
         original_length = len(text)
-        removed_chars = []
         
         # Keep letters (including Unicode), numbers, spaces, and common punctuation
-        # This pattern preserves Unicode characters including Telugu, Hindi, etc.
-        allowed_pattern = r'[\w\s\.\,\!\?\;\:\-\(\)\[\]\{\}\"\'\/\\]'
-        
-        cleaned_text = ""
-        for char in text:
-            if re.match(allowed_pattern, char) or ord(char) > 127:  # Keep Unicode characters
-                cleaned_text += char
-            else:
-                removed_chars.append(char)
+        # Non-ASCII is always kept to preserve Telugu, Hindi, etc.
+        cleaned_text = text.translate(_SPECIAL_CHARS_TABLE)
+        removed_chars = []
+        if len(cleaned_text) != original_length:
+            removed_chars = [char for char in text if ord(char) in _SPECIAL_CHARS_TABLE]
         
         info = {
             "original_length": original_length,
@@ -158,22 +355,14 @@ class TextPreprocessingService:
         
         return cleaned_text, info
     
-    def _normalize_punctuation(self, text: str) -> tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _normalize_punctuation(text: str) -> tuple[str, Dict[str, Any]]:
         """Normalize punctuation marks"""
         original_length = len(text)
         
         # Replace multiple punctuation with single
-        cleaned_text = re.sub(r'[!]{2,}', '!', text)
-        cleaned_text = re.sub(r'[?]{2,}', '?', cleaned_text)
-        cleaned_text = re.sub(r'[.]{2,}', '.', cleaned_text)
-        cleaned_text = re.sub(r'[,]{2,}', ',', cleaned_text)
-        
-        # Normalize quotes
-        cleaned_text = cleaned_text.replace('"', '"').replace('"', '"')
-        cleaned_text = cleaned_text.replace("'", "'").replace("'", "'")
-        
-        # Normalize dashes
-        cleaned_text = re.sub(r'[–—]', '-', cleaned_text)
+        # Quotes and dashes are already folded to ASCII during Unicode normalization
+        cleaned_text = _REPEATED_PUNCT_RE.sub(r'\1', text)
         
         info = {
             "original_length": original_length,
@@ -183,30 +372,19 @@ class TextPreprocessingService:
         
         return cleaned_text, info
     
-    def _fix_common_typos(self, text: str) -> tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _fix_common_typos(text: str) -> tuple[str, Dict[str, Any]]:
         """Fix common typos and misspellings"""
         original_length = len(text)
-        corrections_made = 0
-        
-        # Common typo patterns
-        typo_patterns = {
-            r'\bteh\b': 'the',
-            r'\badn\b': 'and',
-            r'\byuo\b': 'you',
-            r'\bthier\b': 'their',
-            r'\bthere\b': 'there',  # Context-dependent, simplified
-            r'\bseperate\b': 'separate',
-            r'\boccured\b': 'occurred',
-            r'\brecieve\b': 'receive',
-            r'\bacheive\b': 'achieve',
-            r'\bdefinately\b': 'definitely'
-        }
+        corrected_words = set()
+        
+        def _correct(match: re.Match) -> str:
+            word = match.group(0).lower()
+            corrected_words.add(word)
+            return _TYPO_CORRECTIONS[word]
         
-        cleaned_text = text
-        for pattern, replacement in typo_patterns.items():
-            if re.search(pattern, cleaned_text, re.IGNORECASE):
-                cleaned_text = re.sub(pattern, replacement, cleaned_text, flags=re.IGNORECASE)
-                corrections_made += 1
+        cleaned_text = _TYPO_RE.sub(_correct, text)
+        corrections_made = len(corrected_words)
         
         info = {
             "original_length": original_length,
@@ -216,12 +394,13 @@ class TextPreprocessingService:
         
         return cleaned_text, info
     
-    def _segment_sentences(self, text: str) -> tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _segment_sentences(text: str) -> tuple[str, Dict[str, Any]]:
         """Segment text into sentences"""
         original_length = len(text)
         
         # Simple sentence segmentation
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         # Rejoin with proper spacing
@@ -238,7 +417,8 @@ class TextPreprocessingService:
         
         return segmented_text, info
     
-    def _final_cleanup(self, text: str) -> str:
+    @staticmethod
+    def _final_cleanup(text: str) -> str:
         """Final cleanup and validation"""
         # Remove extra spaces
         cleaned_text = ' '.join(text.split())
@@ -0,0 +1,87 @@
+"""
+Micro-batching for translation requests
+"""
+
+import asyncio
+import structlog
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+
+from app.schemas.input_processing import TranslationResult
+
+logger = structlog.get_logger()
+
+BatchTranslateFn = Callable[[List[str], str, str], Awaitable[List[TranslationResult]]]
+
+
+class TranslationBatcher:
+    """Coalesces concurrent translation requests for the same language pair into one batch call"""
+    
+    def __init__(
+        self,
+        translate_batch: BatchTranslateFn,
+        max_batch_size: int,
+        max_wait_ms: int
+    ):
+        self._translate_batch = translate_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> TranslationResult:
+        """Queue text for the next batch of its language pair and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (source_language, target_language)
+        
+        batch = self._pending.setdefault(key, [])
+        batch.append((text, future))
+        
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+        
+        return await future
+    
+    def _flush(self, key: Tuple[str, str]):
+        """Dispatch the pending batch for a language pair"""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.ensure_future(self._run_batch(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(
+        self,
+        key: Tuple[str, str],
+        batch: List[Tuple[str, asyncio.Future]]
+    ):
+        """Translate a batch and resolve each caller's future"""
+        source_language, target_language = key
+        texts = [text for text, _ in batch]
+        
+        try:
+            results = await self._translate_batch(texts, source_language, target_language)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,4 +1,9 @@
-from .base import TranslationProvider
+from .base import (
+    TranslationProvider,
+    AsyncHTTPTranslationProvider,
+    get_http_client,
+    close_http_client
+)
 from .google_translator import GoogleTranslationProvider
 # TODO (Production Phase): Re-enable IndicTrans2 as Fallback Layer 1
 # from .indic_translator import IndicTranslator
@@ -8,6 +13,9 @@ from .nllb_translator import NLLBTranslator
 
 __all__ = [
     "TranslationProvider",
+    "AsyncHTTPTranslationProvider",
+    "get_http_client",
+    "close_http_client",
     "GoogleTranslationProvider", 
     # TODO (Production Phase): Re-enable IndicTrans2 as Fallback Layer 1
     # "IndicTranslator",
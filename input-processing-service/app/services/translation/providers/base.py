@@ -2,14 +2,50 @@
 Base translation provider interface
 """
 
+import asyncio
+import httpx
+import orjson
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
 
+# One connection pool shared by every HTTP provider and the Google language
+# detection fallback, so calls to the same host reuse each other's connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared provider HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=settings.TRANSLATION_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.TRANSLATION_HTTP_MAX_KEEPALIVE,
+                max_connections=settings.TRANSLATION_HTTP_MAX_CONNECTIONS
+            )
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared provider HTTP client and its pooled connections"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class TranslationProvider(ABC):
     """Base class for translation providers"""
     
+    # In-flight requests the strategy lets through to this provider at once
+    max_concurrency: int = 8
+    # Texts sent in one API request; 1 for providers without a batch API
+    max_batch_size: int = 1
+    
     @abstractmethod
     async def translate(
         self, 
@@ -20,6 +56,17 @@ class TranslationProvider(ABC):
         """Translate text from source to target language"""
         pass
     
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[TranslationResult]:
+        """Translate several texts, in order; providers with a native batch API should override this"""
+        return list(await asyncio.gather(
+            *(self.translate(text, source_language, target_language) for text in texts)
+        ))
+    
     @abstractmethod
     async def is_available(self) -> bool:
         """Check if this provider is available and configured"""
@@ -29,3 +76,26 @@ class TranslationProvider(ABC):
     def get_provider_name(self) -> str:
         """Get the name of this provider"""
         pass
+
+
+class AsyncHTTPTranslationProvider(TranslationProvider):
+    """Base class for providers backed by a remote translation HTTP API"""
+    
+    async def _post_json(
+        self,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """POST to the API and return the decoded JSON response"""
+        try:
+            response = await get_http_client().post(
+                url, json=json, data=data, headers=headers, params=params
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise TranslationError(f"API request failed: {str(e)}")
+        
+        return orjson.loads(response.content)
@@ -2,22 +2,27 @@
 Google Translate provider
 """
 
-import structlog
-import requests
 import asyncio
-from typing import Optional
+import structlog
+from typing import List, Optional
 
 from app.core.config import settings
 from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
-from .base import TranslationProvider
+from .base import AsyncHTTPTranslationProvider
 
 logger = structlog.get_logger()
 
+# Maximum q parameters the v2 REST API accepts in one request
+GOOGLE_MAX_BATCH_SIZE = 128
 
-class GoogleTranslationProvider(TranslationProvider):
+
+class GoogleTranslationProvider(AsyncHTTPTranslationProvider):
     """Google Translate API provider using REST API"""
     
+    max_concurrency = 50
+    max_batch_size = GOOGLE_MAX_BATCH_SIZE
+    
     def __init__(self):
         self.api_key = settings.GOOGLE_TRANSLATE_API_KEY
         self.base_url = "https://translation.googleapis.com/language/translate/v2"
@@ -30,11 +35,7 @@ class GoogleTranslationProvider(TranslationProvider):
     ) -> TranslationResult:
         """Translate using Google Translate REST API"""
         try:
-            # Run in thread pool since requests is synchronous
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._translate_sync,
+            result = await self._translate_with_api(
                 text,
                 source_language,
                 target_language
@@ -52,13 +53,45 @@ class GoogleTranslationProvider(TranslationProvider):
         except Exception as e:
             raise TranslationError(f"Google Translate failed: {str(e)}")
     
-    def _translate_sync(
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[TranslationResult]:
+        """Translate several texts with one REST call per GOOGLE_MAX_BATCH_SIZE texts"""
+        try:
+            chunks = await asyncio.gather(*(
+                self._translate_batch_with_api(
+                    texts[start:start + GOOGLE_MAX_BATCH_SIZE],
+                    source_language,
+                    target_language
+                )
+                for start in range(0, len(texts), GOOGLE_MAX_BATCH_SIZE)
+            ))
+            
+            return [
+                TranslationResult(
+                    original_text=text,
+                    translated_text=result['translatedText'],
+                    source_language=source_language,
+                    target_language=target_language,
+                    confidence=result.get('confidence', 0.9),
+                    method="google_translate"
+                )
+                for text, result in zip(texts, (result for chunk in chunks for result in chunk))
+            ]
+            
+        except Exception as e:
+            raise TranslationError(f"Google Translate failed: {str(e)}")
+    
+    async def _translate_with_api(
         self, 
         text: str, 
         source_language: str, 
         target_language: str
     ):
-        """Synchronous translation call using REST API"""
+        """Translation call using REST API over the pooled client"""
         if not self.api_key:
             raise TranslationError("Google Translate API key not configured")
         
@@ -69,10 +102,7 @@ class GoogleTranslationProvider(TranslationProvider):
             'target': target_language
         }
         
-        response = requests.post(self.base_url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
+        result = await self._post_json(self.base_url, params=params)
         
         if 'data' not in result or 'translations' not in result['data']:
             raise TranslationError("Invalid API response format")
@@ -83,6 +113,42 @@ class GoogleTranslationProvider(TranslationProvider):
             'confidence': translation.get('confidence', 0.9)
         }
     
+    async def _translate_batch_with_api(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[dict]:
+        """Batched translation call sending one q form field per text"""
+        if not self.api_key:
+            raise TranslationError("Google Translate API key not configured")
+        
+        # Texts go in the form body, a long query string would hit URL limits
+        data = {
+            'q': texts,
+            'source': source_language,
+            'target': target_language
+        }
+        
+        result = await self._post_json(self.base_url, data=data, params={'key': self.api_key})
+        
+        if 'data' not in result or 'translations' not in result['data']:
+            raise TranslationError("Invalid API response format")
+        
+        translations = result['data']['translations']
+        if len(translations) != len(texts):
+            raise TranslationError(
+                f"Expected {len(texts)} translations, got {len(translations)}"
+            )
+        
+        return [
+            {
+                'translatedText': translation['translatedText'],
+                'confidence': translation.get('confidence', 0.9)
+            }
+            for translation in translations
+        ]
+    
     async def is_available(self) -> bool:
         """Check if Google Translate is available"""
         return self.api_key is not None
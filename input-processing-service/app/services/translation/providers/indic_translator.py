@@ -2,21 +2,23 @@
 IndicTrans2 translation provider
 """
 
+import re
 import structlog
-import requests
-import json
-import asyncio
+from functools import lru_cache
 from typing import Optional
 
 from app.core.config import settings
 from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
-from .base import TranslationProvider
+from .base import AsyncHTTPTranslationProvider
 
 logger = structlog.get_logger()
 
+# Runs of whitespace and special characters, each replaced by a single space
+_SEPARATOR_RUN_RE = re.compile(r'[^\w\u0900-\u097F]+')
 
-class IndicTranslator(TranslationProvider):
+
+class IndicTranslator(AsyncHTTPTranslationProvider):
     """IndicTrans2 model provider for Indic to English translation"""
     
     def __init__(self):
@@ -70,41 +72,22 @@ class IndicTranslator(TranslationProvider):
             "Authorization": f"Bearer {settings.HUGGINGFACE_API_KEY}"
         }
         
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: requests.post(
-                    self.endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=30
-                )
-            )
-            
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            if isinstance(result, dict) and "translated_text" in result:
-                return result["translated_text"]
-            elif isinstance(result, list) and len(result) > 0:
-                return str(result[0])
-            else:
-                raise TranslationError(f"Unexpected API response format: {result}")
-                
-        except requests.RequestException as e:
-            raise TranslationError(f"API request failed: {str(e)}")
-    
-    def _clean_text_for_translation(self, text: str) -> str:
-        """Clean text for better translation results"""
-        # Remove excessive whitespace and normalize
-        cleaned = " ".join(text.strip().split())
+        result = await self._post_json(self.endpoint, json=payload, headers=headers)
         
-        # Remove special characters that might cause issues
-        import re
-        cleaned = re.sub(r'[^\w\s\u0900-\u097F]', ' ', cleaned)
-        
-        return cleaned.strip()
+        if isinstance(result, dict) and "translated_text" in result:
+            return result["translated_text"]
+        elif isinstance(result, list) and len(result) > 0:
+            return str(result[0])
+        else:
+            raise TranslationError(f"Unexpected API response format: {result}")
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_text_for_translation(text: str) -> str:
+        """Clean text for better translation results (memoized, hot texts repeat)"""
+        # Remove special characters that might cause issues and normalize
+        # whitespace in a single pass
+        return _SEPARATOR_RUN_RE.sub(' ', text).strip()
     
     async def is_available(self) -> bool:
         """Check if IndicTrans2 is available"""
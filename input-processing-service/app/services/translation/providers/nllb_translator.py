@@ -3,20 +3,18 @@ NLLB-200 translation provider
 """
 
 import structlog
-import requests
-import json
-import asyncio
+from functools import lru_cache
 from typing import Optional
 
 from app.core.config import settings
 from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
-from .base import TranslationProvider
+from .base import AsyncHTTPTranslationProvider
 
 logger = structlog.get_logger()
 
 
-class NLLBTranslator(TranslationProvider):
+class NLLBTranslator(AsyncHTTPTranslationProvider):
     """NLLB-200 model provider for multilingual translation"""
     
     def __init__(self):
@@ -70,33 +68,19 @@ class NLLBTranslator(TranslationProvider):
             "Authorization": f"Bearer {settings.HUGGINGFACE_API_KEY}"
         }
         
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: requests.post(
-                    self.endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=30
-                )
-            )
-            
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            if isinstance(result, dict) and "translated_text" in result:
-                return result["translated_text"]
-            elif isinstance(result, list) and len(result) > 0:
-                return str(result[0])
-            else:
-                raise TranslationError(f"Unexpected API response format: {result}")
-                
-        except requests.RequestException as e:
-            raise TranslationError(f"API request failed: {str(e)}")
+        result = await self._post_json(self.endpoint, json=payload, headers=headers)
+        
+        if isinstance(result, dict) and "translated_text" in result:
+            return result["translated_text"]
+        elif isinstance(result, list) and len(result) > 0:
+            return str(result[0])
+        else:
+            raise TranslationError(f"Unexpected API response format: {result}")
     
-    def _clean_text_for_translation(self, text: str) -> str:
-        """Clean text for better translation results"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_text_for_translation(text: str) -> str:
+        """Clean text for better translation results (memoized, hot texts repeat)"""
         # Remove excessive whitespace and normalize
         cleaned = " ".join(text.strip().split())
         return cleaned.strip()
@@ -0,0 +1,84 @@
+"""
+Learned provider routing for translation requests
+"""
+
+import structlog
+import time
+from typing import Dict, List, Tuple
+
+from .providers import TranslationProvider
+
+logger = structlog.get_logger()
+
+
+class RouteStats:
+    """Tracks an exponentially weighted success rate per provider and language pair"""
+    
+    def __init__(self, alpha: float, min_success_rate: float, recovery_half_life: float):
+        self.alpha = alpha
+        self.min_success_rate = min_success_rate
+        self.recovery_half_life = recovery_half_life
+        # (success rate, monotonic time it was last updated)
+        self._success_rates: Dict[Tuple[str, str, str], Tuple[float, float]] = {}
+    
+    def record(
+        self,
+        provider: TranslationProvider,
+        source_language: str,
+        target_language: str,
+        success: bool
+    ):
+        """Fold the outcome of one provider attempt into its success rate"""
+        key = (provider.get_provider_name(), source_language, target_language)
+        previous = self.success_rate(provider, source_language, target_language)
+        self._success_rates[key] = (
+            previous + self.alpha * (float(success) - previous),
+            time.monotonic()
+        )
+    
+    def success_rate(
+        self,
+        provider: TranslationProvider,
+        source_language: str,
+        target_language: str
+    ) -> float:
+        """
+        Expected success rate, optimistic for routes without history
+        
+        Failures fade by half every recovery_half_life seconds, so a demoted
+        provider is tried first again after a while even if nothing has called
+        it since; the more it failed, the longer that takes.
+        """
+        key = (provider.get_provider_name(), source_language, target_language)
+        entry = self._success_rates.get(key)
+        if entry is None:
+            return 1.0
+        
+        rate, updated_at = entry
+        elapsed = time.monotonic() - updated_at
+        return 1.0 - (1.0 - rate) * 0.5 ** (elapsed / self.recovery_half_life)
+    
+    def order(
+        self,
+        providers: List[TranslationProvider],
+        source_language: str,
+        target_language: str
+    ) -> List[TranslationProvider]:
+        """Keep the priority order, moving providers that keep failing for this pair to the end"""
+        healthy = []
+        demoted = []
+        for provider in providers:
+            if self.success_rate(provider, source_language, target_language) < self.min_success_rate:
+                demoted.append(provider)
+            else:
+                healthy.append(provider)
+        
+        if demoted:
+            logger.info(
+                "Demoting failing translation providers",
+                providers=[provider.get_provider_name() for provider in demoted],
+                source_lang=source_language,
+                target_lang=target_language
+            )
+        
+        return healthy + demoted
@@ -2,10 +2,16 @@
 Translation strategy for managing provider fallback chain
 """
 
+import asyncio
+import time
 import structlog
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
+from prometheus_client import Counter
+from app.core.config import settings
 from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
+from .batching import TranslationBatcher
+from .routing import RouteStats
 from .providers import (
     TranslationProvider,
     GoogleTranslationProvider,
@@ -17,13 +23,38 @@ from .providers import (
 
 logger = structlog.get_logger()
 
+# Prometheus metrics
+TRANSLATION_HEDGED_REQUESTS = Counter(
+    'translation_hedged_requests_total',
+    'Provider attempts started because the previous provider was slow',
+    ['provider']
+)
+TRANSLATION_HEDGE_WINS = Counter(
+    'translation_hedge_wins_total',
+    'Batches answered by a provider that was started as a hedge',
+    ['provider']
+)
+
 
 class TranslationStrategy:
     """Manages translation provider fallback strategy"""
     
     def __init__(self):
         self.providers: List[TranslationProvider] = []
+        self._availability: Dict[TranslationProvider, bool] = {}
+        self._availability_checked_at = 0.0
+        self._semaphores: Dict[TranslationProvider, asyncio.Semaphore] = {}
         self._initialize_providers()
+        self._route_stats = RouteStats(
+            settings.TRANSLATION_ROUTE_EWMA_ALPHA,
+            settings.TRANSLATION_ROUTE_MIN_SUCCESS_RATE,
+            settings.TRANSLATION_ROUTE_RECOVERY_HALF_LIFE
+        )
+        self._batcher = TranslationBatcher(
+            self.translate_batch_with_fallback,
+            settings.TRANSLATION_BATCH_MAX_SIZE,
+            settings.TRANSLATION_BATCH_MAX_WAIT_MS
+        )
     
     def _initialize_providers(self):
         """Initialize providers in priority order - MVP 2-layer system"""
@@ -50,54 +81,196 @@ class TranslationStrategy:
         1. Google Translate (most reliable)
         2. NLLB-200 (general purpose fallback)
         
+        Concurrent calls for the same language pair are coalesced into one
+        batch by the batcher before reaching the providers.
+        
         TODO (Production Phase): Re-enable IndicTrans2 as Fallback Layer 1
         Future 3-layer system: Google → IndicTrans2 → NLLB
         """
+        return await self._batcher.submit(text, source_language, target_language)
+    
+    async def translate_batch_with_fallback(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[TranslationResult]:
+        """
+        Translate a batch of texts with the first provider that succeeds
+        
+        Providers are raced as hedged requests: if the current provider has not
+        answered within TRANSLATION_HEDGE_DELAY_MS the next one is started
+        alongside it, and a failure starts the next one immediately. The first
+        successful result wins and the remaining attempts are cancelled.
+        With TRANSLATION_HEDGING_ENABLED off, providers are only tried one
+        after another as each fails.
+        """
         logger.info(
             "Starting translation with fallback strategy",
-            text_length=len(text),
+            batch_size=len(texts),
+            text_length=sum(len(text) for text in texts),
             source_lang=source_language,
             target_lang=target_language
         )
         
-        last_error = None
+        hedge_delay = (
+            settings.TRANSLATION_HEDGE_DELAY_MS / 1000
+            if settings.TRANSLATION_HEDGING_ENABLED else None
+        )
+        availability = await self._get_availability()
         
+        available_providers = []
         for provider in self.providers:
-            try:
-                # Check if provider is available
-                if not await provider.is_available():
-                    logger.warning(
-                        f"Provider {provider.get_provider_name()} is not available, skipping"
-                    )
-                    continue
-                
-                logger.info(f"Attempting translation with {provider.get_provider_name()}")
+            if availability[provider]:
+                available_providers.append(provider)
+            else:
+                logger.warning(
+                    f"Provider {provider.get_provider_name()} is not available, skipping"
+                )
+        # Providers that keep failing for this language pair are tried last
+        providers = iter(
+            self._route_stats.order(available_providers, source_language, target_language)
+        )
+        attempts: Dict[asyncio.Task, TranslationProvider] = {}
+        hedges: Set[asyncio.Task] = set()
+        last_error = None
+        
+        def start_next_provider(hedge: bool = False) -> bool:
+            """Start an attempt with the next available provider, if any"""
+            provider = next(providers, None)
+            if provider is None:
+                return False
+            
+            logger.info(f"Attempting translation with {provider.get_provider_name()}")
+            task = asyncio.create_task(
+                self._translate_with_provider(provider, texts, source_language, target_language)
+            )
+            attempts[task] = provider
+            if hedge:
+                hedges.add(task)
+                TRANSLATION_HEDGED_REQUESTS.labels(provider=provider.get_provider_name()).inc()
+            return True
+        
+        has_more = start_next_provider()
+        
+        try:
+            while attempts:
+                done, _ = await asyncio.wait(
+                    attempts,
+                    timeout=hedge_delay if has_more else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
                 
-                # Try translation with this provider
-                result = await provider.translate(text, source_language, target_language)
+                if not done:
+                    # Current attempts are slow, hedge with the next provider
+                    logger.info("Translation provider slow, starting hedged request")
+                    has_more = start_next_provider(hedge=True)
+                    continue
                 
-                logger.info(f"Translation successful with {provider.get_provider_name()}")
-                return result
+                for task in done:
+                    provider = attempts.pop(task)
+                    try:
+                        results = task.result()
+                    except Exception as e:
+                        last_error = e
+                        self._route_stats.record(provider, source_language, target_language, False)
+                        logger.warning(
+                            f"Translation failed with {provider.get_provider_name()}",
+                            error=str(e)
+                        )
+                        continue
+                    
+                    logger.info(f"Translation successful with {provider.get_provider_name()}")
+                    self._route_stats.record(provider, source_language, target_language, True)
+                    if task in hedges:
+                        TRANSLATION_HEDGE_WINS.labels(provider=provider.get_provider_name()).inc()
+                    return results
                 
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    f"Translation failed with {provider.get_provider_name()}",
-                    error=str(e)
-                )
-                continue
+                if has_more:
+                    has_more = start_next_provider()
+        finally:
+            for task in attempts:
+                task.cancel()
         
         # If all providers failed
         logger.error("All translation providers failed")
         raise TranslationError(f"Translation failed: {str(last_error)}")
     
+    async def _get_availability(self) -> Dict[TranslationProvider, bool]:
+        """Probe every provider concurrently, reusing results for TRANSLATION_AVAILABILITY_TTL seconds"""
+        fresh = (
+            time.monotonic() - self._availability_checked_at
+            < settings.TRANSLATION_AVAILABILITY_TTL
+        )
+        if fresh and all(provider in self._availability for provider in self.providers):
+            return self._availability
+        
+        results = await asyncio.gather(
+            *(self._check_available(provider) for provider in self.providers)
+        )
+        self._availability = dict(zip(self.providers, results))
+        self._availability_checked_at = time.monotonic()
+        return self._availability
+    
+    async def _check_available(self, provider: TranslationProvider) -> bool:
+        """Check one provider, treating a failed probe as unavailable"""
+        try:
+            return await provider.is_available()
+        except Exception as e:
+            logger.warning(
+                f"Availability check failed for {provider.get_provider_name()}",
+                error=str(e)
+            )
+            return False
+    
+    async def _translate_with_provider(
+        self,
+        provider: TranslationProvider,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[TranslationResult]:
+        """Translate a batch with a single provider, one API request per max_batch_size texts"""
+        if len(texts) == 1:
+            return await self._translate_request(provider, texts, source_language, target_language)
+        
+        chunk_size = provider.max_batch_size
+        chunks = await asyncio.gather(*(
+            self._translate_request(
+                provider,
+                texts[start:start + chunk_size],
+                source_language,
+                target_language
+            )
+            for start in range(0, len(texts), chunk_size)
+        ))
+        return [result for chunk in chunks for result in chunk]
+    
+    async def _translate_request(
+        self,
+        provider: TranslationProvider,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[TranslationResult]:
+        """Send one API request to a provider, within its concurrency limit"""
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = self._semaphores[provider] = asyncio.Semaphore(provider.max_concurrency)
+        
+        async with semaphore:
+            if len(texts) == 1:
+                return [await provider.translate(texts[0], source_language, target_language)]
+            return await provider.translate_batch(texts, source_language, target_language)
+    
     async def get_available_providers(self) -> List[str]:
         """Get list of available provider names"""
-        available = []
-        for provider in self.providers:
-            if await provider.is_available():
-                available.append(provider.get_provider_name())
-        return available
+        availability = await self._get_availability()
+        return [
+            provider.get_provider_name()
+            for provider in self.providers
+            if availability[provider]
+        ]
     
     async def test_provider(self, provider_name: str) -> bool:
         """Test if a specific provider is working"""
@@ -105,3 +278,24 @@ class TranslationStrategy:
             if provider.get_provider_name() == provider_name:
                 return await provider.is_available()
         return False
+
+
+# Strategy shared by every facade, so the batcher coalesces requests from
+# concurrent pipeline runs instead of only within one run
+_strategy: Optional[TranslationStrategy] = None
+
+
+def get_translation_strategy() -> TranslationStrategy:
+    """Get the shared translation strategy, creating it on first use"""
+    global _strategy
+    if _strategy is None:
+        _strategy = TranslationStrategy()
+    return _strategy
+
+
+async def init_translation_strategy() -> TranslationStrategy:
+    """Create the shared translation strategy and probe its providers before the first request"""
+    strategy = get_translation_strategy()
+    available_providers = await strategy.get_available_providers()
+    logger.info("Translation providers initialized", available_providers=available_providers)
+    return strategy
@@ -2,28 +2,94 @@
 Translation facade to maintain compatibility when replacing the monolith TranslationService
 """
 
+import asyncio
+import orjson
+import re
 import structlog
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 import redis.asyncio as aioredis
+from prometheus_client import Counter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.exceptions import TranslationError
-from app.core.redis import CacheService
+from app.core.redis import CacheService, compress_value, decompress_value, hash_text
 from app.schemas.input_processing import TranslationResult
-from .strategy import TranslationStrategy
+from .strategy import TranslationStrategy, get_translation_strategy
 
 logger = structlog.get_logger()
 
+# Prometheus metrics
+TRANSLATION_CACHE_LOOKUPS = Counter(
+    'translation_cache_lookups_total',
+    'Translation lookups by the layer that answered them',
+    ['layer']
+)
+
+# In-process LRU tier in front of Redis, shared by all facade instances;
+# entries are (result, monotonic expiry time)
+_local_cache: "OrderedDict[str, Tuple[TranslationResult, float]]" = OrderedDict()
+
+# Translations currently being looked up or translated, keyed by cache key
+_inflight: Dict[str, "asyncio.Future[TranslationResult]"] = {}
+
+# Any letter in any script; text without one has nothing to translate
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Cache key prefix per language pair, built once per pair
+_cache_key_prefixes: Dict[Tuple[str, str], str] = {}
+
+
+def _cache_key(text: str, source_language: str, target_language: str) -> str:
+    """Build the translation cache key for a text and language pair"""
+    language_pair = (source_language, target_language)
+    prefix = _cache_key_prefixes.get(language_pair)
+    if prefix is None:
+        prefix = _cache_key_prefixes[language_pair] = (
+            f"translation:{source_language}:{target_language}:"
+        )
+    return prefix + hash_text(text)
+
+
+def _get_local(cache_key: str) -> Optional[TranslationResult]:
+    """Get an unexpired translation from the local cache, marking it recently used"""
+    entry = _local_cache.get(cache_key)
+    if entry is None:
+        return None
+    
+    result, expires_at = entry
+    if expires_at <= time.monotonic():
+        del _local_cache[cache_key]
+        return None
+    
+    _local_cache.move_to_end(cache_key)
+    return result
+
+
+def _set_local(cache_key: str, result: TranslationResult):
+    """Store a translation in the local cache, evicting the least recently used entry"""
+    _local_cache[cache_key] = (result, time.monotonic() + settings.TRANSLATION_LOCAL_CACHE_TTL)
+    _local_cache.move_to_end(cache_key)
+    if len(_local_cache) > settings.TRANSLATION_LOCAL_CACHE_SIZE:
+        _local_cache.popitem(last=False)
+
 
 class TranslationServiceFacade:
     """Facade that maintains the original TranslationService API while using new provider architecture"""
     
-    def __init__(self, db: AsyncSession, redis: aioredis.Redis):
+    def __init__(
+        self, 
+        db: AsyncSession, 
+        redis: aioredis.Redis, 
+        strategy: Optional[TranslationStrategy] = None
+    ):
         self.db = db
         self.redis = redis
         self.cache_service = CacheService(redis)
-        self.strategy = TranslationStrategy()
+        # Providers and their connection pools outlive any single request
+        self.strategy = strategy or get_translation_strategy()
     
     async def translate_text(
         self, 
@@ -38,18 +104,98 @@ class TranslationServiceFacade:
         if target_language is None:
             target_language = settings.DEFAULT_TARGET_LANGUAGE
         
+        # Nothing to translate, skip the caches and providers entirely
+        if source_language == target_language:
+            return self._untranslated_result(text, source_language, target_language, "identity")
+        if not _LETTER_RE.search(text):
+            return self._untranslated_result(text, source_language, target_language, "noop")
+        
         logger.info("Starting translation", 
                    source_lang=source_language, 
                    target_lang=target_language,
                    text_length=len(text))
         
-        # Check cache first
-        cache_key = f"translation:{hash(text)}:{source_language}:{target_language}"
+        # Check local cache first, then Redis
+        cache_key = _cache_key(text, source_language, target_language)
+        result = _get_local(cache_key)
+        
+        # Cached results carry their source text, so a digest collision is a miss
+        if result is not None and result.original_text == text:
+            logger.info("Translation result found in local cache")
+            TRANSLATION_CACHE_LOOKUPS.labels(layer="local").inc()
+            return result
+        
+        # Concurrent requests for the same text wait on the first one
+        inflight = _inflight.get(cache_key)
+        if inflight is not None:
+            logger.info("Translation already in flight, waiting for result")
+            TRANSLATION_CACHE_LOOKUPS.labels(layer="inflight").inc()
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request we waited on was cancelled, translate it ourselves
+                logger.info("In-flight translation was cancelled, retrying")
+                return await self.translate_text(text, source_language, target_language)
+        
+        future = asyncio.get_running_loop().create_future()
+        _inflight[cache_key] = future
+        
+        try:
+            result = await self._translate_uncached(
+                text, source_language, target_language, cache_key
+            )
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody was waiting
+            future.exception()
+            raise
+        finally:
+            # Cancellation skips both branches above, release any waiters
+            if not future.done():
+                future.cancel()
+            del _inflight[cache_key]
+    
+    def _untranslated_result(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        method: str
+    ) -> TranslationResult:
+        """Result returning the text unchanged, for input that needs no provider"""
+        return TranslationResult(
+            original_text=text,
+            translated_text=text,
+            source_language=source_language,
+            target_language=target_language,
+            confidence=1.0,
+            method=method
+        )
+    
+    async def _translate_uncached(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        cache_key: str
+    ) -> TranslationResult:
+        """Look up Redis and fall back to the providers, populating both cache tiers"""
         cached_result = await self.cache_service.get(cache_key)
         
         if cached_result:
-            logger.info("Translation result found in cache")
-            return TranslationResult.parse_raw(cached_result)
+            result = TranslationResult.model_validate(orjson.loads(decompress_value(cached_result)))
+            if result.original_text == text:
+                logger.info("Translation result found in cache")
+                TRANSLATION_CACHE_LOOKUPS.labels(layer="redis").inc()
+                _set_local(cache_key, result)
+                return result
+            logger.warning("Translation cache key collision, treating as miss", cache_key=cache_key)
+        
+        TRANSLATION_CACHE_LOOKUPS.labels(layer="miss").inc()
         
         try:
 
@@ -61,9 +207,10 @@ class TranslationServiceFacade:
             logger.info("Translation completed", method=result.method)
             
             # Cache the result
-            await self.cache_service.set(
+            _set_local(cache_key, result)
+            self.cache_service.set_in_background(
                 cache_key, 
-                result.json(), 
+                compress_value(orjson.dumps(result.model_dump())), 
                 settings.CACHE_TTL_TRANSLATION
             )
             
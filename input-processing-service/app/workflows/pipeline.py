@@ -2,9 +2,12 @@
 Input processing pipeline workflow
 """
 
+from dataclasses import dataclass
+from typing import Optional
 from fastapi import BackgroundTasks
 import structlog
 import redis.asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
 from app.core.redis import get_redis
@@ -18,41 +21,76 @@ from app.schemas.input_processing import ProcessingPhase, ProcessingStatus
 logger = structlog.get_logger()
 
 
+@dataclass
+class PipelineServices:
+    """Services used by one pipeline run"""
+    validation: InputValidationService
+    language: LanguageDetectionService
+    translation: TranslationService
+    preprocessing: TextPreprocessingService
+    storage: InputStorageService
+    
+    @classmethod
+    def create(cls, db: AsyncSession, redis: aioredis.Redis) -> "PipelineServices":
+        """Create the real services bound to a database session and Redis client"""
+        return cls(
+            validation=InputValidationService(db, redis),
+            language=LanguageDetectionService(db, redis),
+            translation=TranslationService(db, redis),
+            preprocessing=TextPreprocessingService(db, redis),
+            storage=InputStorageService(db, redis)
+        )
+
+
 async def process_input_pipeline(
     input_id: int,
     text: str,
-    user_id: int
+    user_id: int,
+    services: Optional[PipelineServices] = None
 ):
     """
     Background task for processing input through the complete pipeline
-    Creates its own database and Redis sessions since request sessions are closed
+    Creates its own database and Redis sessions since request sessions are closed,
+    unless services are passed in
     """
-    logger.info("Starting input processing pipeline", 
-                input_id=input_id, 
-                text_length=len(text),
-                user_id=user_id)
-    print(f"DEBUG: Pipeline started for input_id={input_id}, text='{text[:50]}...'")
-    print(f"DEBUG: Text bytes: {text.encode('utf-8')}")
-    print(f"DEBUG: Text repr: {repr(text)}")
+    if services is not None:
+        await _run_pipeline(input_id, text, user_id, services)
+        return
     
     # Create new database session for background task
     async with AsyncSessionLocal() as db:
         # Create new Redis connection for background task
         redis = await get_redis()
+        await _run_pipeline(input_id, text, user_id, PipelineServices.create(db, redis))
+
+
+async def _run_pipeline(
+    input_id: int,
+    text: str,
+    user_id: int,
+    services: PipelineServices
+):
+    """Run every phase of the pipeline with the given services"""
+    logger.info("Starting input processing pipeline", 
+                input_id=input_id, 
+                text_length=len(text),
+                user_id=user_id)
+    logger.debug("Pipeline input", input_id=input_id, text_preview=text[:50])
+    
+    try:
+        validation_service = services.validation
+        language_service = services.language
+        translation_service = services.translation
+        preprocessing_service = services.preprocessing
+        storage_service = services.storage
         
-        try:
-            # Initialize services with new sessions
-            validation_service = InputValidationService(db, redis)
-            language_service = LanguageDetectionService(db, redis)
-            translation_service = TranslationService(db, redis)
-            preprocessing_service = TextPreprocessingService(db, redis)
-            storage_service = InputStorageService(db, redis)
-            
-            logger.info("Services initialized, starting validation phase", input_id=input_id)
-            
-            # Phase 1: Validation
-            await storage_service.update_processing_status(
-                input_id, ProcessingPhase.VALIDATION, ProcessingStatus.PROCESSING, 10
+        logger.info("Services initialized, starting validation phase", input_id=input_id)
+        
+        # Phase 1: Validation
+        # Each phase's status updates are written once, when the phase ends
+        async with storage_service.batch(input_id) as status_batch:
+            status_batch.update_processing_status(
+                ProcessingPhase.VALIDATION, ProcessingStatus.PROCESSING, 10
             )
             
             validation_result = await validation_service.validate_input(
@@ -60,25 +98,29 @@ async def process_input_pipeline(
             )
             
             if not validation_result.is_valid:
-                await storage_service.update_processing_status(
-                    input_id, ProcessingPhase.VALIDATION, ProcessingStatus.FAILED, 0,
+                status_batch.update_processing_status(
+                    ProcessingPhase.VALIDATION, ProcessingStatus.FAILED, 0,
                     error_message="Validation failed",
-                    error_details={"validation_result": validation_result.dict()}
+                    error_details={"validation_result": validation_result}
                 )
                 return
             
-            await storage_service.update_processing_status(
-                input_id, ProcessingPhase.VALIDATION, ProcessingStatus.COMPLETED, 25
+            status_batch.update_processing_status(
+                ProcessingPhase.VALIDATION, ProcessingStatus.COMPLETED, 25
             )
-            
-            # Phase 2: Language Detection
-            logger.info("Starting language detection phase", input_id=input_id)
-            await storage_service.update_processing_status(
-                input_id, ProcessingPhase.LANGUAGE_DETECTION, ProcessingStatus.PROCESSING, 30
+        
+        # Phase 2: Language Detection
+        logger.info("Starting language detection phase", input_id=input_id)
+        async with storage_service.batch(input_id) as status_batch:
+            status_batch.update_processing_status(
+                ProcessingPhase.LANGUAGE_DETECTION, ProcessingStatus.PROCESSING, 30
             )
             
             language_result = await language_service.detect_language(text)
-            print(f"DEBUG: Language detected: {language_result.language}, confidence: {language_result.confidence}")
+            logger.debug("Language detected", 
+                         input_id=input_id, 
+                         language=language_result.language, 
+                         confidence=language_result.confidence)
             
             # Store language detection results in input record
             await storage_service.update_language_detection_results(
@@ -87,88 +129,96 @@ async def process_input_pipeline(
                 language_result.confidence
             )
             
-            await storage_service.update_processing_status(
-                input_id, ProcessingPhase.LANGUAGE_DETECTION, ProcessingStatus.COMPLETED, 50,
-                phase_data={"language_result": language_result.dict()}
+            status_batch.update_processing_status(
+                ProcessingPhase.LANGUAGE_DETECTION, ProcessingStatus.COMPLETED, 50,
+                phase_data={"language_result": language_result}
             )
-            
-            # Phase 3: Translation (if needed)
-            processed_text = text
-            if language_result.language != "en":
-                logger.info("Starting translation phase", 
-                           input_id=input_id, 
-                           source_lang=language_result.language)
-                await storage_service.update_processing_status(
-                    input_id, ProcessingPhase.TRANSLATION, ProcessingStatus.PROCESSING, 60
+        
+        # Phase 3: Translation (if needed)
+        processed_text = text
+        is_english = language_result.language == "en"
+        if not is_english:
+            logger.info("Starting translation phase", 
+                       input_id=input_id, 
+                       source_lang=language_result.language)
+            async with storage_service.batch(input_id) as status_batch:
+                status_batch.update_processing_status(
+                    ProcessingPhase.TRANSLATION, ProcessingStatus.PROCESSING, 60
                 )
                 
+                # Providers get the user's text as typed; line breaks and symbols carry meaning
                 translation_result = await translation_service.translate_text(
                     text, language_result.language, "en"
                 )
                 
                 processed_text = translation_result.translated_text
                 
+                # Dumped once, the input record and the phase status share it
+                translation_data = translation_result.model_dump(mode="json")
+                
                 # Store translation results in input record
                 await storage_service.update_translation_results(
                     input_id, 
-                    translation_result.dict()
+                    translation_data
                 )
                 
                 logger.info("Translation completed", 
                            input_id=input_id, 
                            method=translation_result.method)
                 
-                await storage_service.update_processing_status(
-                    input_id, ProcessingPhase.TRANSLATION, ProcessingStatus.COMPLETED, 75,
-                    phase_data={"translation_result": translation_result.dict()}
-                )
-            else:
-                logger.info("Translation skipped - text already in English", input_id=input_id)
-                await storage_service.update_processing_status(
-                    input_id, ProcessingPhase.TRANSLATION, ProcessingStatus.SKIPPED, 75,
-                    phase_data={"reason": "Text is already in English"}
+                status_batch.update_processing_status(
+                    ProcessingPhase.TRANSLATION, ProcessingStatus.COMPLETED, 75,
+                    phase_data={"translation_result": translation_data}
                 )
-            
-            # Phase 4: Text Preprocessing
-            logger.info("Starting preprocessing phase", input_id=input_id)
+        else:
+            logger.info("Translation skipped - text already in English", input_id=input_id)
             await storage_service.update_processing_status(
-                input_id, ProcessingPhase.PREPROCESSING, ProcessingStatus.PROCESSING, 80
+                input_id, ProcessingPhase.TRANSLATION, ProcessingStatus.SKIPPED, 75,
+                phase_data={"reason": "Text is already in English"}
+            )
+        
+        # Phase 4: Text Preprocessing
+        logger.info("Starting preprocessing phase", input_id=input_id)
+        async with storage_service.batch(input_id) as status_batch:
+            status_batch.update_processing_status(
+                ProcessingPhase.PREPROCESSING, ProcessingStatus.PROCESSING, 80
             )
             
+            # Every step runs once, on the English text scene analysis will see
             preprocessing_result = await preprocessing_service.preprocess_text(
                 processed_text
             )
             
             logger.info("Preprocessing completed", input_id=input_id)
+            status_batch.update_processing_status(
+                ProcessingPhase.PREPROCESSING, ProcessingStatus.COMPLETED, 100,
+                phase_data={"preprocessing_result": preprocessing_result}
+            )
+        
+        # Update final status
+        await storage_service.update_input_record_status(
+            input_id, "completed", "preprocessing_complete"
+        )
+        
+        logger.info("Input processing pipeline completed", input_id=input_id)
+        
+    except Exception as e:
+        logger.error("Input processing pipeline failed", 
+                    input_id=input_id, 
+                    error=str(e))
+        
+        # Try to update status with error information
+        try:
             await storage_service.update_processing_status(
-                input_id, ProcessingPhase.PREPROCESSING, ProcessingStatus.COMPLETED, 100,
-                phase_data={"preprocessing_result": preprocessing_result.dict()}
+                input_id, ProcessingPhase.VALIDATION, ProcessingStatus.FAILED, 0,
+                error_message=str(e),
+                error_details={"exception_type": type(e).__name__}
             )
             
-            # Update final status
             await storage_service.update_input_record_status(
-                input_id, "completed", "preprocessing_complete"
+                input_id, "failed", "pipeline_error"
             )
-            
-            logger.info("Input processing pipeline completed", input_id=input_id)
-            
-        except Exception as e:
-            logger.error("Input processing pipeline failed", 
+        except Exception as status_error:
+            logger.error("Failed to update error status", 
                         input_id=input_id, 
-                        error=str(e))
-            
-            # Try to update status with error information
-            try:
-                await storage_service.update_processing_status(
-                    input_id, ProcessingPhase.VALIDATION, ProcessingStatus.FAILED, 0,
-                    error_message=str(e),
-                    error_details={"exception_type": type(e).__name__}
-                )
-                
-                await storage_service.update_input_record_status(
-                    input_id, "failed", "pipeline_error"
-                )
-            except Exception as status_error:
-                logger.error("Failed to update error status", 
-                            input_id=input_id, 
-                            error=str(status_error))
+                        error=str(status_error))
@@ -6,18 +6,32 @@ Handles Phase 1 of the video generation pipeline: input processing and validatio
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import uvicorn
+import orjson
 import structlog
 from prometheus_client import Counter, generate_latest, CONTENT_TYPE_LATEST
 from prometheus_client import make_asgi_app
 
 from app.core.config import settings
-from app.core.database import init_db
-from app.core.redis import init_redis
+from app.core.database import init_db, close_db
+from app.core.redis import init_redis, close_redis, flush_background_writes
 from app.api.v1.router import api_router
 from app.core.middleware import LoggingMiddleware, MetricsMiddleware
 from app.core.exceptions import InputProcessingException
+from app.services.language_detection import warm_up_language_detection
+from app.services.translation.providers import close_http_client
+from app.services.translation.strategy import init_translation_strategy
+from app.services.text_preprocessing import (
+    warm_up_preprocessing_executor,
+    shutdown_preprocessing_executor
+)
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSON serializer for structlog; stdlib logging needs str, not orjson's bytes"""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
 
 # Configure structured logging
 structlog.configure(
@@ -30,7 +44,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -43,6 +57,21 @@ logger = structlog.get_logger()
 # Prometheus metrics (only unique ones not defined in middleware)
 INPUT_PROCESSING_COUNT = Counter('input_processing_total', 'Total input processing requests', ['status', 'language'])
 
+# Static endpoint bodies, serialized once instead of per request
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "input-processing-service",
+    "version": settings.SERVICE_VERSION
+})
+_READY_BODY = orjson.dumps({"status": "ready"})
+_ROOT_BODY = orjson.dumps({
+    "service": "Input Processing Service",
+    "version": settings.SERVICE_VERSION,
+    "description": "Phase 1: Input processing and validation for video generation platform",
+    "docs": "/docs",
+    "health": "/health"
+})
+
 # Create FastAPI application
 app = FastAPI(
     title="Input Processing Service",
@@ -101,29 +130,41 @@ async def startup_event():
     await init_redis()
     logger.info("Redis initialized")
     
+    # Start preprocessing workers and load detection models before the
+    # first request needs them
+    await warm_up_preprocessing_executor()
+    warm_up_language_detection()
+    
+    # Create the translation providers once for the lifetime of the app
+    await init_translation_strategy()
+    
     logger.info("Input Processing Service started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down Input Processing Service")
+    
+    shutdown_preprocessing_executor()
+    
+    # Let pending cache writes reach Redis
+    await flush_background_writes()
+    
+    await close_http_client()
+    await close_redis()
+    await close_db()
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint for service monitoring"""
-    return {
-        "status": "healthy",
-        "service": "input-processing-service",
-        "version": settings.SERVICE_VERSION,
-        "timestamp": "2024-01-01T00:00:00Z"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/ready")
 async def readiness_check():
     """Readiness check endpoint for Kubernetes"""
     # Add database and Redis connectivity checks here
-    return {"status": "ready"}
+    return Response(content=_READY_BODY, media_type="application/json")
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
@@ -132,13 +173,7 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/")
 async def root():
     """Root endpoint with service information"""
-    return {
-        "service": "Input Processing Service",
-        "version": settings.SERVICE_VERSION,
-        "description": "Phase 1: Input processing and validation for video generation platform",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -0,0 +1,157 @@
+"""
+In-process fakes of the pipeline services for workflow tests
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.schemas.input_processing import (
+    ValidationResult,
+    LanguageDetectionResult,
+    TranslationResult,
+    PreprocessingResult,
+    ProcessingPhase,
+    ProcessingStatus
+)
+
+
+class FakeValidationService:
+    """Returns a fixed validation result, or raises the given error"""
+    
+    def __init__(self, is_valid: bool = True, error: Optional[Exception] = None):
+        self.result = ValidationResult(is_valid=is_valid)
+        self.error = error
+        self.calls: List[str] = []
+    
+    async def validate_input(
+        self,
+        text: str,
+        user_id: int = None,
+        session_id: str = None
+    ) -> ValidationResult:
+        self.calls.append(text)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class FakeLanguageDetectionService:
+    """Detects every text as the given language"""
+    
+    def __init__(self, language: str = "en"):
+        self.language = language
+        self.calls: List[str] = []
+    
+    async def detect_language(self, text: str) -> LanguageDetectionResult:
+        self.calls.append(text)
+        return LanguageDetectionResult(
+            language=self.language,
+            confidence=0.95,
+            is_reliable=True
+        )
+
+
+class FakeTranslationService:
+    """Translates by tagging the text with the target language"""
+    
+    def __init__(self):
+        self.calls: List[Tuple[str, str, str]] = []
+    
+    async def translate_text(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str = "en"
+    ) -> TranslationResult:
+        self.calls.append((text, source_language, target_language))
+        return TranslationResult(
+            original_text=text,
+            translated_text=f"[{target_language}] {text}",
+            source_language=source_language,
+            target_language=target_language,
+            confidence=0.9,
+            method="fake"
+        )
+
+
+class FakePreprocessingService:
+    """Records the text it preprocessed, leaving it unchanged"""
+    
+    def __init__(self):
+        self.calls: List[str] = []
+    
+    async def preprocess_text(self, text: str) -> PreprocessingResult:
+        self.calls.append(text)
+        return PreprocessingResult(original_text=text, processed_text=text)
+
+
+class FakeStatusBatch:
+    """Writes status updates straight to the fake storage"""
+    
+    def __init__(self, storage: "FakeStorageService", input_id: int):
+        self.storage = storage
+        self.input_id = input_id
+    
+    def update_processing_status(
+        self,
+        phase: ProcessingPhase,
+        status: ProcessingStatus,
+        progress_percentage: int = 0,
+        phase_data: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        error_details: Optional[Dict[str, Any]] = None
+    ):
+        self.storage.status_updates.append((phase, status))
+    
+    async def __aenter__(self) -> "FakeStatusBatch":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeStorageService:
+    """Keeps every write in memory"""
+    
+    def __init__(self):
+        self.status_updates: List[Tuple[ProcessingPhase, ProcessingStatus]] = []
+        self.record_statuses: List[str] = []
+        self.detected_language: Optional[str] = None
+        self.translation_result: Optional[Dict[str, Any]] = None
+    
+    def batch(self, input_id: int) -> FakeStatusBatch:
+        return FakeStatusBatch(self, input_id)
+    
+    async def update_processing_status(
+        self,
+        input_id: int,
+        phase: ProcessingPhase,
+        status: ProcessingStatus,
+        progress_percentage: int = 0,
+        phase_data: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        error_details: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        self.status_updates.append((phase, status))
+        return True
+    
+    async def update_input_record_status(
+        self,
+        input_id: int,
+        status: str,
+        current_phase: Optional[str] = None
+    ) -> bool:
+        self.record_statuses.append(status)
+        return True
+    
+    async def update_language_detection_results(
+        self,
+        input_id: int,
+        detected_language: str,
+        language_confidence: float
+    ) -> bool:
+        self.detected_language = detected_language
+        return True
+    
+    async def update_translation_results(self, input_id: int, translation_result) -> bool:
+        self.translation_result = translation_result
+        return True
@@ -0,0 +1,56 @@
+"""
+Tests for language detection service
+"""
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+from app.core.config import settings
+from app.core.redis import flush_background_writes
+from app.schemas.input_processing import LanguageDetectionResult
+from app.services.language_detection import LanguageDetectionService
+
+
+@pytest.fixture
+def language_service():
+    """Create language detection service instance for testing"""
+    db = AsyncMock()
+    redis = AsyncMock()
+    redis.get.return_value = None
+    return LanguageDetectionService(db, redis)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def flush_cache_writes():
+    """Let cache writes scheduled by a test finish on that test's event loop"""
+    yield
+    await flush_background_writes()
+
+
+@pytest.mark.asyncio
+async def test_romanized_hindi_is_not_labelled_english(language_service):
+    """Test that romanized Hindi reaches full detection, with or without the ASCII shortcut"""
+    text = "mujhe ek action movie chahiye jisme hero villain se ladta hai"
+    hindi = LanguageDetectionResult(
+        language="hi", confidence=0.9, is_reliable=True, alternative_languages=[]
+    )
+    
+    for shortcut in [False, True]:
+        with patch.object(settings, "LANGUAGE_DETECTION_ASCII_SHORTCUT", shortcut), \
+             patch.object(language_service, "_detect_with_langdetect", return_value=hindi):
+            result = await language_service.detect_language(text)
+        
+        assert result.language == "hi"
+
+
+@pytest.mark.asyncio
+async def test_ascii_shortcut_skips_detection_for_english(language_service):
+    """Test that enabled shortcut answers for ASCII text langid classifies as English"""
+    text = "A hero walks into the old city as the sun sets"
+    
+    with patch.object(settings, "LANGUAGE_DETECTION_ASCII_SHORTCUT", True), \
+         patch.object(language_service, "_detect_with_langdetect") as detect:
+        result = await language_service.detect_language(text)
+    
+    assert result.language == "en"
+    assert not detect.called
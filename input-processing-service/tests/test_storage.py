@@ -0,0 +1,231 @@
+"""
+Tests for batched processing status writes
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.exceptions import DatabaseError
+from app.models.processing_status import ProcessingStatus
+from app.repositories.status_repository import StatusRepository
+from app.services.storage_facade import InputStorageService, StorageBatch
+from app.schemas.input_processing import (
+    ProcessingPhase,
+    ProcessingStatus as ProcessingStatusEnum
+)
+
+
+def make_db(existing=None) -> AsyncMock:
+    """Async session mock whose status lookup returns the given rows"""
+    db = AsyncMock()
+    db.add = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = existing or []
+    db.execute.return_value = result
+    return db
+
+
+def make_input_storage_service(rows) -> InputStorageService:
+    """Storage service over a mocked session returning the given status rows, with an empty cache"""
+    service = InputStorageService(make_db(rows), AsyncMock())
+    service.cache_manager = AsyncMock()
+    service.cache_manager.get_cached_status_summary.return_value = None
+    return service
+
+
+def make_status_row(
+    input_id: int,
+    phase: ProcessingPhase,
+    status: ProcessingStatusEnum,
+    progress_percentage: int,
+    created_at: datetime
+) -> ProcessingStatus:
+    """Processing status row as loaded from the database"""
+    return ProcessingStatus(
+        input_record_id=input_id,
+        phase=phase.value,
+        status=status.value,
+        progress_percentage=progress_percentage,
+        started_at=created_at,
+        completed_at=created_at if status == ProcessingStatusEnum.COMPLETED else None,
+        created_at=created_at
+    )
+
+
+def make_storage_service() -> MagicMock:
+    """Storage service mock recording the batched updates it is asked to write"""
+    storage_service = MagicMock()
+    storage_service.update_processing_statuses = AsyncMock(return_value=True)
+    return storage_service
+
+
+@pytest.mark.asyncio
+async def test_storage_batch_last_update_per_phase_wins():
+    """Test that only the latest update per phase is written, keeping earlier phase data"""
+    storage_service = make_storage_service()
+    
+    async with StorageBatch(storage_service, 1) as batch:
+        batch.update_processing_status(
+            ProcessingPhase.VALIDATION, ProcessingStatusEnum.PROCESSING, 10,
+            phase_data={"step": "started"}
+        )
+        batch.update_processing_status(
+            ProcessingPhase.VALIDATION, ProcessingStatusEnum.COMPLETED, 25
+        )
+        batch.update_processing_status(
+            ProcessingPhase.LANGUAGE_DETECTION, ProcessingStatusEnum.PROCESSING, 30
+        )
+    
+    storage_service.update_processing_statuses.assert_awaited_once()
+    input_id, updates = storage_service.update_processing_statuses.call_args.args
+    assert input_id == 1
+    assert [update["phase"] for update in updates] == [
+        ProcessingPhase.VALIDATION, ProcessingPhase.LANGUAGE_DETECTION
+    ]
+    assert updates[0]["status"] == ProcessingStatusEnum.COMPLETED
+    assert updates[0]["progress_percentage"] == 25
+    assert updates[0]["phase_data"] == {"step": "started"}
+
+
+@pytest.mark.asyncio
+async def test_storage_batch_keeps_first_started_at():
+    """Test that a superseded update keeps the time the phase was first reported"""
+    storage_service = make_storage_service()
+    
+    async with StorageBatch(storage_service, 1) as batch:
+        before = datetime.now(timezone.utc)
+        batch.update_processing_status(
+            ProcessingPhase.TRANSLATION, ProcessingStatusEnum.PROCESSING, 60
+        )
+        between = datetime.now(timezone.utc)
+        batch.update_processing_status(
+            ProcessingPhase.TRANSLATION, ProcessingStatusEnum.COMPLETED, 75
+        )
+    
+    _, updates = storage_service.update_processing_statuses.call_args.args
+    assert before <= updates[0]["started_at"] <= between
+
+
+@pytest.mark.asyncio
+async def test_storage_batch_flushes_after_exception():
+    """Test that updates are written when the batch body raises, and the error propagates"""
+    storage_service = make_storage_service()
+    
+    with pytest.raises(ValueError):
+        async with StorageBatch(storage_service, 1) as batch:
+            batch.update_processing_status(
+                ProcessingPhase.VALIDATION, ProcessingStatusEnum.FAILED, 0,
+                error_message="Validation failed"
+            )
+            raise ValueError("Service error")
+    
+    _, updates = storage_service.update_processing_statuses.call_args.args
+    assert updates[0]["status"] == ProcessingStatusEnum.FAILED
+    assert updates[0]["error_message"] == "Validation failed"
+
+
+@pytest.mark.asyncio
+async def test_storage_batch_flush_error_does_not_mask_exception():
+    """Test that a failing flush does not replace the error that ended the batch"""
+    storage_service = make_storage_service()
+    storage_service.update_processing_statuses.side_effect = DatabaseError("Database down")
+    
+    with pytest.raises(ValueError):
+        async with StorageBatch(storage_service, 1) as batch:
+            batch.update_processing_status(
+                ProcessingPhase.VALIDATION, ProcessingStatusEnum.PROCESSING, 10
+            )
+            raise ValueError("Service error")
+    
+    # Without an error in the body, the flush failure itself is raised
+    with pytest.raises(DatabaseError):
+        async with StorageBatch(storage_service, 1) as batch:
+            batch.update_processing_status(
+                ProcessingPhase.VALIDATION, ProcessingStatusEnum.PROCESSING, 10
+            )
+
+
+@pytest.mark.asyncio
+async def test_update_many_creates_completed_row():
+    """Test that a new row for a completed phase gets its start, completion and duration"""
+    db = make_db()
+    started_at = datetime.now(timezone.utc) - timedelta(seconds=5)
+    
+    await StatusRepository(db).update_many(1, [{
+        "phase": ProcessingPhase.VALIDATION,
+        "status": ProcessingStatusEnum.COMPLETED,
+        "progress_percentage": 25,
+        "started_at": started_at
+    }])
+    
+    row = db.add.call_args.args[0]
+    assert row.input_record_id == 1
+    assert row.phase == ProcessingPhase.VALIDATION.value
+    assert row.status == ProcessingStatusEnum.COMPLETED.value
+    assert row.started_at == started_at
+    assert row.completed_at is not None
+    assert row.duration_seconds == 5
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_many_updates_existing_row():
+    """Test that an existing row keeps its start time and is not added again"""
+    started_at = datetime.now(timezone.utc) - timedelta(seconds=3)
+    existing = ProcessingStatus(
+        input_record_id=1,
+        phase=ProcessingPhase.TRANSLATION.value,
+        status=ProcessingStatusEnum.PROCESSING.value,
+        progress_percentage=60,
+        started_at=started_at
+    )
+    db = make_db([existing])
+    
+    await StatusRepository(db).update_many(1, [{
+        "phase": ProcessingPhase.TRANSLATION,
+        "status": ProcessingStatusEnum.COMPLETED,
+        "progress_percentage": 75,
+        "phase_data": {"method": "google_translate"},
+        "started_at": datetime.now(timezone.utc)
+    }])
+    
+    assert not db.add.called
+    assert existing.status == ProcessingStatusEnum.COMPLETED.value
+    assert existing.progress_percentage == 75
+    assert existing.phase_data == {"method": "google_translate"}
+    assert existing.started_at == started_at
+    assert existing.duration_seconds == 3
+
+
+@pytest.mark.asyncio
+async def test_complete_processing_status_bulk_matches_per_input():
+    """Test that the bulk lookup groups rows into the same responses as per-input lookups"""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        make_status_row(1, ProcessingPhase.VALIDATION, ProcessingStatusEnum.COMPLETED, 25, start),
+        make_status_row(
+            1, ProcessingPhase.LANGUAGE_DETECTION, ProcessingStatusEnum.PROCESSING, 30,
+            start + timedelta(seconds=1)
+        ),
+        make_status_row(
+            2, ProcessingPhase.VALIDATION, ProcessingStatusEnum.FAILED, 0,
+            start + timedelta(seconds=2)
+        )
+    ]
+    input_ids = [1, 2, 3]
+    
+    # The bulk query returns rows ordered by input, then creation time
+    bulk = await make_input_storage_service(rows).get_complete_processing_status_bulk(input_ids)
+    
+    for input_id in input_ids:
+        input_rows = [row for row in rows if row.input_record_id == input_id]
+        expected = await make_input_storage_service(input_rows).get_complete_processing_status(input_id)
+        
+        assert bulk.get(input_id) == expected
+    
+    assert set(bulk) == {1, 2}
+    assert bulk[1].current_phase == ProcessingPhase.LANGUAGE_DETECTION
+    assert [phase.phase for phase in bulk[1].phases] == [
+        ProcessingPhase.VALIDATION, ProcessingPhase.LANGUAGE_DETECTION
+    ]
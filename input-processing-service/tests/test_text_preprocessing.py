@@ -0,0 +1,141 @@
+"""
+Tests for text preprocessing service
+"""
+
+import pytest
+import pytest_asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.core.redis import flush_background_writes
+from app.services import text_preprocessing
+from app.services.text_preprocessing import TextPreprocessingService
+
+
+@pytest.fixture
+def preprocessing_service():
+    """Create preprocessing service instance for testing"""
+    db = AsyncMock()
+    redis = AsyncMock()
+    redis.get.return_value = None
+    return TextPreprocessingService(db, redis)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def flush_cache_writes():
+    """Let cache writes scheduled by a test finish on that test's event loop"""
+    yield
+    await flush_background_writes()
+
+
+@pytest.mark.asyncio
+async def test_preprocess_clean_ascii_uses_fast_path(preprocessing_service):
+    """Test that clean ASCII input skips the normalization steps"""
+    text = "A hero walks  into the old city. teh sun is setting"
+    
+    result = await preprocessing_service.preprocess_text(text)
+    
+    assert result.preprocessing_steps[0] == "fast_path"
+    assert "unicode_normalization" not in result.preprocessing_steps
+    assert result.processed_text == "A hero walks into the old city. the sun is setting."
+
+
+@pytest.mark.asyncio
+async def test_preprocess_text_needing_work_uses_full_pipeline(preprocessing_service):
+    """Test that control characters, symbols and repeated punctuation disable the fast path"""
+    for text in ["Tabs\there", "Price is $5", "Wait!! What", "नमस्ते दुनिया"]:
+        result = await preprocessing_service.preprocess_text(text)
+        
+        assert "fast_path" not in result.preprocessing_steps
+        assert "unicode_normalization" in result.preprocessing_steps
+
+
+def test_normalize_unicode_folds_quotes_and_dashes():
+    """Test that typographic quotes and dashes become ASCII"""
+    text = "\u201cHello\u201d \u2018world\u2019 \u2013 day\u2014night\u200b"
+    
+    cleaned_text, info = TextPreprocessingService._normalize_unicode(text)
+    
+    assert cleaned_text == "\"Hello\" 'world' - day-night"
+    assert info["removed_chars_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_preprocess_text_caching(preprocessing_service):
+    """Test preprocessing result caching"""
+    text = "A hero walks into the old city."
+    
+    result = await preprocessing_service.preprocess_text(text)
+    
+    # Verify cache was set
+    await flush_background_writes()
+    preprocessing_service.redis.setex.assert_called_once()
+    cached_value = preprocessing_service.redis.setex.call_args.args[2]
+    assert isinstance(cached_value, bytes)
+    
+    # Test cache hit skips the pipeline
+    preprocessing_service.redis.get.return_value = cached_value.decode()
+    
+    with patch("app.services.text_preprocessing._preprocess_sync") as mock_pipeline:
+        cached_result = await preprocessing_service.preprocess_text(text)
+    
+    assert not mock_pipeline.called
+    assert cached_result == result
+
+
+def test_fast_path_matches_full_pipeline():
+    """Test that the fast path produces the same text as the full pipeline"""
+    texts = [
+        "  A hero walks into the old city.  The sun is setting  ",
+        "Where are you? I recieve your letter (yesterday) - definately!",
+        "Path: C:\\scenes\\intro [draft] {v1}; 'quoted' \"text\"",
+    ]
+    
+    for text in texts:
+        fast_result = TextPreprocessingService._run_pipeline(text)
+        with patch.object(TextPreprocessingService, "_is_clean_ascii", return_value=False):
+            full_result = TextPreprocessingService._run_pipeline(text)
+        
+        assert fast_result.preprocessing_steps[0] == "fast_path"
+        assert fast_result.processed_text == full_result.processed_text
+
+
+def test_unicode_strip_table_stays_bounded():
+    """Test that normalizing many distinct code points does not grow the translate table"""
+    table_size = len(text_preprocessing._UNICODE_STRIP_TABLE)
+    text = "".join(map(chr, range(0x4E00, 0x4E00 + 20000))) + "\u200b"
+    
+    cleaned_text, info = TextPreprocessingService._normalize_unicode(text)
+    
+    assert len(cleaned_text) == 20000
+    assert info["removed_chars_count"] == 1
+    assert len(text_preprocessing._UNICODE_STRIP_TABLE) == table_size
+    assert text_preprocessing._is_stripped.cache_info().currsize <= 4096
+
+
+@pytest.mark.asyncio
+async def test_preprocess_short_text_runs_inline(preprocessing_service):
+    """Test that short text is preprocessed without a process pool round trip"""
+    with patch("app.services.text_preprocessing.get_preprocessing_executor") as get_executor:
+        result = await preprocessing_service.preprocess_text("A hero walks into the old city")
+    
+    assert result.processed_text == "A hero walks into the old city."
+    assert not get_executor.called
+
+
+@pytest.mark.asyncio
+async def test_preprocess_restarts_broken_process_pool(preprocessing_service):
+    """Test that a broken process pool is replaced and the call retried"""
+    text = "A hero walks into the old city. " * 20
+    broken = MagicMock()
+    broken.submit.side_effect = BrokenProcessPool("A worker died")
+    
+    with patch.object(text_preprocessing, "_executor", broken), \
+         patch("app.services.text_preprocessing.ProcessPoolExecutor", ThreadPoolExecutor):
+        result = await preprocessing_service.preprocess_text(text)
+        replacement = text_preprocessing._executor
+        text_preprocessing.shutdown_preprocessing_executor()
+    
+    assert result.processed_text.startswith("A hero walks into the old city.")
+    broken.shutdown.assert_called_once()
+    assert isinstance(replacement, ThreadPoolExecutor)
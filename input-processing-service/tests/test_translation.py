@@ -2,8 +2,13 @@
 Tests for translation service with Google → IndicTrans2 → NLLB fallback chain
 """
 
+import asyncio
+import orjson
 import pytest
+from collections import OrderedDict
 from unittest.mock import AsyncMock, MagicMock, patch
+from app.core.config import settings
+from app.core.redis import flush_background_writes
 from app.services.translation import TranslationService
 from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
@@ -203,30 +208,128 @@ async def test_clean_text_for_translation(translation_service):
 
 @pytest.mark.asyncio
 async def test_translation_caching(translation_service):
-    """Test translation result caching"""
-    # Mock cache service
-    translation_service.cache_service.get.return_value = None
-    translation_service.cache_service.set = AsyncMock()
+    """Test translation result caching in the local and Redis tiers"""
+    translation_service.redis.get.return_value = None
+    translation_service.strategy = AsyncMock()
+    translation_service.strategy.translate_with_fallback.return_value = TranslationResult(
+        original_text="नमस्ते दुनिया",
+        translated_text="Hello world",
+        source_language="hi",
+        target_language="en",
+        confidence=0.95,
+        method="google_translate"
+    )
     
-    # Mock Google Translate success
-    translation_service.google_client = MagicMock()
-    translation_service.google_client.translate.return_value = {
-        'translatedText': 'Hello world',
-        'confidence': 0.95
-    }
+    with patch("app.services.translation.translation_facade._local_cache", OrderedDict()):
+        result = await translation_service.translate_text("नमस्ते दुनिया", "hi", "en")
+        
+        # Verify cache was set
+        await flush_background_writes()
+        translation_service.redis.setex.assert_called_once()
+        
+        # Test local cache hit survives Redis failing
+        translation_service.redis.get.side_effect = Exception("Redis down")
+        
+        cached_result = await translation_service.translate_text("नमस्ते दुनिया", "hi", "en")
+        
+        assert cached_result == result
+        assert translation_service.strategy.translate_with_fallback.call_count == 1
+        
+        # Test expired local entries fall through to Redis
+        translation_service.redis.get.side_effect = None
+        translation_service.redis.get.return_value = translation_service.redis.setex.call_args.args[2]
+        
+        with patch.object(settings, "TRANSLATION_LOCAL_CACHE_TTL", 0):
+            with patch("app.services.translation.translation_facade._local_cache", OrderedDict()):
+                await translation_service.translate_text("नमस्ते दुनिया", "hi", "en")
+                redis_result = await translation_service.translate_text("नमस्ते दुनिया", "hi", "en")
     
-    result = await translation_service.translate_text(
-        "नमस्ते दुनिया", "hi", "en"
+    assert redis_result == result
+    assert translation_service.redis.get.call_count == 3
+    assert translation_service.strategy.translate_with_fallback.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_translation_cache_compresses_long_results(translation_service):
+    """Test that long translations are stored gzipped in Redis and read back intact"""
+    text = "नमस्ते दुनिया " * 40
+    translation_service.redis.get.return_value = None
+    translation_service.strategy = AsyncMock()
+    translation_service.strategy.translate_with_fallback.return_value = TranslationResult(
+        original_text=text,
+        translated_text="Hello world " * 60,
+        source_language="hi",
+        target_language="en",
+        confidence=0.95,
+        method="google_translate"
     )
     
-    # Verify cache was set
-    translation_service.cache_service.set.assert_called_once()
+    with patch("app.services.translation.translation_facade._local_cache", OrderedDict()):
+        result = await translation_service.translate_text(text, "hi", "en")
+        await flush_background_writes()
     
-    # Test cache hit
-    translation_service.cache_service.get.return_value = result.json()
+    stored = translation_service.redis.setex.call_args.args[2]
+    assert stored.startswith("gz:")
+    assert len(stored) < len(orjson.dumps(result.model_dump()))
     
-    cached_result = await translation_service.translate_text(
-        "नमस्ते दुनिया", "hi", "en"
-    )
+    translation_service.redis.get.return_value = stored
+    with patch("app.services.translation.translation_facade._local_cache", OrderedDict()):
+        cached_result = await translation_service.translate_text(text, "hi", "en")
+    
+    assert cached_result == result
+    assert translation_service.strategy.translate_with_fallback.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_translate_text_deduplicates_concurrent_requests(translation_service):
+    """Test that concurrent identical translations share one provider call"""
+    translation_service.redis.get.return_value = None
+    
+    async def translate_with_fallback(text, source, target):
+        await asyncio.sleep(0.01)
+        return TranslationResult(
+            original_text=text,
+            translated_text="Hello world",
+            source_language=source,
+            target_language=target,
+            confidence=0.95,
+            method="google_translate"
+        )
+    
+    translation_service.strategy = AsyncMock()
+    translation_service.strategy.translate_with_fallback.side_effect = translate_with_fallback
+    
+    with patch("app.services.translation.translation_facade._local_cache", OrderedDict()):
+        results = await asyncio.gather(*(
+            translation_service.translate_text("नमस्ते दुनिया", "hi", "en")
+            for _ in range(10)
+        ))
+    
+    assert translation_service.strategy.translate_with_fallback.call_count == 1
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_translate_text_same_language_is_identity(translation_service):
+    """Test that translating into the source language skips caches and providers"""
+    result = await translation_service.translate_text("Hello world", "en", "en")
+    
+    assert result.translated_text == "Hello world"
+    assert result.method == "identity"
+    assert result.confidence == 1.0
+    assert not translation_service.redis.get.called
+
+
+@pytest.mark.asyncio
+async def test_translate_text_without_letters_is_noop(translation_service):
+    """Test that empty, whitespace-only and punctuation-only text never reaches a provider"""
+    translation_service.strategy = AsyncMock()
+    translation_service.strategy.translate_with_fallback.side_effect = Exception("Provider called")
+    
+    for text in ["", "   \n\t", "!!! ... ???", "123 - 456"]:
+        result = await translation_service.translate_text(text, "hi", "en")
+        
+        assert result.translated_text == text
+        assert result.method == "noop"
     
-    assert cached_result.translated_text == "Hello world"
+    assert not translation_service.redis.get.called
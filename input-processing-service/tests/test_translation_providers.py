@@ -2,8 +2,13 @@
 Tests for translation providers architecture
 """
 
+import asyncio
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+import random
+import re
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.translation.providers import (
     GoogleTranslationProvider,
@@ -12,7 +17,9 @@ from app.services.translation.providers import (
     NLLBTranslator,
     # HuggingFaceTranslator - REMOVED for MVP (2-layer system)
 )
+from app.services.translation.providers.indic_translator import IndicTranslator
 from app.services.translation.strategy import TranslationStrategy
+from app.core.config import settings
 from app.core.exceptions import TranslationError
 from app.schemas.input_processing import TranslationResult
 
@@ -21,19 +28,43 @@ from app.schemas.input_processing import TranslationResult
 async def test_google_translator_success():
     """Test successful Google Translate translation"""
     provider = GoogleTranslationProvider()
+    provider.api_key = "test-key"
     
-    # Mock Google client
-    provider.client = MagicMock()
-    provider.client.translate.return_value = {
-        'translatedText': 'Hello world',
-        'confidence': 0.95
-    }
+    response = httpx.Response(
+        200,
+        json={"data": {"translations": [
+            {"translatedText": "Hello world", "confidence": 0.95}
+        ]}},
+        request=httpx.Request("POST", provider.base_url)
+    )
     
-    result = await provider.translate("Hello world", "en", "es")
+    with patch("httpx.AsyncClient.post", AsyncMock(return_value=response)) as mock_post:
+        result = await provider.translate("नमस्ते दुनिया", "hi", "en")
     
     assert result.translated_text == "Hello world"
     assert result.method == "google_translate"
     assert result.confidence == 0.95
+    mock_post.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_google_translator_shares_http_client():
+    """Test that separate Google provider instances send requests through one pooled client"""
+    providers = [GoogleTranslationProvider(), GoogleTranslationProvider()]
+    response = httpx.Response(
+        200,
+        json={"data": {"translations": [{"translatedText": "Hello"}]}},
+        request=httpx.Request("POST", providers[0].base_url)
+    )
+    
+    with patch.object(httpx.AsyncClient, "post", autospec=True, return_value=response) as mock_post:
+        for provider in providers:
+            provider.api_key = "test-key"
+            await provider.translate("नमस्ते", "hi", "en")
+    
+    clients = [call.args[0] for call in mock_post.call_args_list]
+    assert len(clients) == 2
+    assert clients[0] is clients[1]
 
 
 @pytest.mark.asyncio
@@ -41,13 +72,40 @@ async def test_google_translator_not_available():
     """Test Google Translate when not available"""
     provider = GoogleTranslationProvider()
     
-    # No client initialized
-    provider.client = None
+    # No API key configured
+    provider.api_key = None
     
     is_available = await provider.is_available()
     assert not is_available
 
 
+@pytest.mark.asyncio
+async def test_google_translator_batch():
+    """Test that a batch of texts is translated with one Google API request"""
+    provider = GoogleTranslationProvider()
+    provider.api_key = "test-key"
+    texts = ["नमस्ते", "धन्यवाद", "दुनिया"]
+    
+    response = httpx.Response(
+        200,
+        json={"data": {"translations": [
+            {"translatedText": "Hello"},
+            {"translatedText": "Thank you"},
+            {"translatedText": "World"}
+        ]}},
+        request=httpx.Request("POST", provider.base_url)
+    )
+    
+    with patch("httpx.AsyncClient.post", AsyncMock(return_value=response)) as mock_post:
+        results = await provider.translate_batch(texts, "hi", "en")
+    
+    mock_post.assert_awaited_once()
+    assert mock_post.call_args.kwargs["data"]["q"] == texts
+    assert [result.original_text for result in results] == texts
+    assert [result.translated_text for result in results] == ["Hello", "Thank you", "World"]
+    assert all(result.method == "google_translate" for result in results)
+
+
 # TODO (Production Phase): Re-enable IndicTrans2 as Fallback Layer 1
 # @pytest.mark.asyncio
 # async def test_indic_translator_api_success():
@@ -69,6 +127,26 @@ async def test_google_translator_not_available():
 #         assert result.method == "indic_trans2"
 
 
+def test_indic_clean_text_collapses_removed_characters():
+    """Test that removed special characters do not leave runs of spaces behind"""
+    cleaned = IndicTranslator._clean_text_for_translation("  नमस्ते , दुनिया!!  how   are you?  ")
+    
+    assert cleaned == "नमस्ते दुनिया how are you"
+
+
+def test_indic_clean_text_matches_reference_cleaner():
+    """Test the single-pass cleaner against the strip-then-collapse reference on random input"""
+    special_chars = re.compile(r'[^\w\s\u0900-\u097F]')
+    alphabet = "aZ9_ \t\n\u00a0\u3000.,!?@#/:-'\"नमस्तेदुनिया।॥\u200b\u0b95é"
+    rng = random.Random(7)
+    
+    for _ in range(1000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        expected = " ".join(special_chars.sub(' ', text).split())
+        
+        assert IndicTranslator._clean_text_for_translation(text) == expected
+
+
 @pytest.mark.asyncio
 async def test_nllb_translator_api_success():
     """Test successful NLLB API translation"""
@@ -83,6 +161,27 @@ async def test_nllb_translator_api_success():
     assert result.method == "nllb_200"
 
 
+@pytest.mark.asyncio
+async def test_nllb_translator_posts_through_shared_client():
+    """Test that NLLB requests go through the pooled async HTTP client"""
+    provider = NLLBTranslator()
+    provider.endpoint = "https://api.example.com/nllb"
+    
+    response = httpx.Response(
+        200,
+        json={"translated_text": "Hello world"},
+        request=httpx.Request("POST", provider.endpoint)
+    )
+    
+    with patch("httpx.AsyncClient.post", AsyncMock(return_value=response)) as mock_post:
+        result = await provider.translate("नमस्ते  दुनिया", "hi", "en")
+    
+    assert result.translated_text == "Hello world"
+    mock_post.assert_awaited_once()
+    assert mock_post.call_args.args[0] == "https://api.example.com/nllb"
+    assert mock_post.call_args.kwargs["json"]["text"] == "नमस्ते दुनिया"
+
+
 @pytest.mark.asyncio
 async def test_translation_strategy_fallback():
     """Test translation strategy with provider fallback - MVP 2-layer system"""
@@ -130,6 +229,284 @@ async def test_translation_strategy_all_providers_fail():
             await strategy.translate_with_fallback("Hello", "hi", "en")
 
 
+@pytest.mark.asyncio
+async def test_translation_strategy_coalesces_concurrent_calls():
+    """Test that concurrent translations for one language pair reach the provider as one batch"""
+    strategy = TranslationStrategy()
+    texts = [f"Sentence {i}" for i in range(8)]
+    
+    provider = MagicMock()
+    provider.max_concurrency = 50
+    provider.max_batch_size = 128
+    provider.get_provider_name.return_value = "google_translate"
+    provider.is_available = AsyncMock(return_value=True)
+    provider.translate_batch = AsyncMock(side_effect=lambda batch, source, target: [
+        TranslationResult(
+            original_text=text,
+            translated_text=text.upper(),
+            source_language=source,
+            target_language=target,
+            confidence=0.9,
+            method="google_translate"
+        )
+        for text in batch
+    ])
+    strategy.providers = [provider]
+    
+    results = await asyncio.gather(
+        *(strategy.translate_with_fallback(text, "hi", "en") for text in texts)
+    )
+    
+    assert provider.translate_batch.call_count == 1
+    assert provider.translate_batch.call_args.args[0] == texts
+    assert [result.translated_text for result in results] == [text.upper() for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_translation_strategy_learned_routing():
+    """Test that a provider failing repeatedly for a language pair is no longer tried first"""
+    strategy = TranslationStrategy()
+    
+    provider1 = MagicMock()
+    provider1.max_concurrency = 50
+    provider1.get_provider_name.return_value = "google_translate"
+    provider1.is_available = AsyncMock(return_value=True)
+    provider1.translate = AsyncMock(side_effect=Exception("Unsupported language"))
+    
+    provider2 = MagicMock()
+    provider2.max_concurrency = 8
+    provider2.get_provider_name.return_value = "nllb_200"
+    provider2.is_available = AsyncMock(return_value=True)
+    provider2.translate = AsyncMock(side_effect=lambda text, source, target: TranslationResult(
+        original_text=text,
+        translated_text="Hello",
+        source_language=source,
+        target_language=target,
+        confidence=0.75,
+        method="nllb_200"
+    ))
+    
+    strategy.providers = [provider1, provider2]
+    
+    # With the default alpha of 0.2, eight straight failures drop the success rate below 0.2
+    for _ in range(8):
+        await strategy.translate_with_fallback("ᱥᱟᱱᱛᱟᱲᱤ", "sat", "en")
+    
+    assert provider1.translate.call_count == 8
+    provider1.reset_mock()
+    
+    result = await strategy.translate_with_fallback("ᱥᱟᱱᱛᱟᱲᱤ", "sat", "en")
+    
+    assert result.method == "nllb_200"
+    assert not provider1.translate.called
+    
+    # Other language pairs keep the configured priority
+    await strategy.translate_with_fallback("नमस्ते", "hi", "en")
+    assert provider1.translate.called
+    provider1.reset_mock()
+    
+    # Failures fade over time, so the demoted provider is tried first again
+    strategy._route_stats.recovery_half_life = 0.01
+    await asyncio.sleep(0.05)
+    await strategy.translate_with_fallback("ᱥᱟᱱᱛᱟᱲᱤ", "sat", "en")
+    
+    assert provider1.translate.called
+
+
+@pytest.mark.asyncio
+async def test_translation_strategy_bounds_provider_concurrency():
+    """Test that no more than max_concurrency requests reach a provider at once"""
+    strategy = TranslationStrategy()
+    in_flight = 0
+    peak = 0
+    
+    async def translate(text, source, target):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return TranslationResult(
+            original_text=text,
+            translated_text=text,
+            source_language=source,
+            target_language=target,
+            confidence=0.75,
+            method="nllb_200"
+        )
+    
+    provider = MagicMock()
+    provider.max_concurrency = 2
+    provider.get_provider_name.return_value = "nllb_200"
+    provider.is_available = AsyncMock(return_value=True)
+    provider.translate = AsyncMock(side_effect=translate)
+    strategy.providers = [provider]
+    
+    results = await asyncio.gather(*(
+        strategy.translate_batch_with_fallback([f"Sentence {i}"], "hi", "en")
+        for i in range(20)
+    ))
+    
+    assert provider.translate.call_count == 20
+    assert peak == 2
+    assert [batch[0].translated_text for batch in results] == [f"Sentence {i}" for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_translation_strategy_bounds_fanned_out_batches():
+    """Test that coalesced batches for a provider without a batch API stay within max_concurrency"""
+    strategy = TranslationStrategy()
+    in_flight = 0
+    peak = 0
+    
+    async def translate(text, source, target):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return TranslationResult(
+            original_text=text,
+            translated_text=text.upper(),
+            source_language=source,
+            target_language=target,
+            confidence=0.75,
+            method="nllb_200"
+        )
+    
+    provider = NLLBTranslator()
+    provider.max_concurrency = 8
+    provider.is_available = AsyncMock(return_value=True)
+    provider.translate = AsyncMock(side_effect=translate)
+    strategy.providers = [provider]
+    texts = [f"Sentence {i}" for i in range(64)]
+    
+    results = await asyncio.gather(
+        *(strategy.translate_with_fallback(text, "hi", "en") for text in texts)
+    )
+    
+    assert provider.translate.call_count == 64
+    assert peak == 8
+    assert [result.translated_text for result in results] == [text.upper() for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_translation_strategy_splits_batches_per_request():
+    """Test that a batch larger than max_batch_size is sent as several gated API requests"""
+    strategy = TranslationStrategy()
+    in_flight = 0
+    peak = 0
+    
+    async def translate_batch(batch, source, target):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [
+            TranslationResult(
+                original_text=text,
+                translated_text=text.upper(),
+                source_language=source,
+                target_language=target,
+                confidence=0.9,
+                method="google_translate"
+            )
+            for text in batch
+        ]
+    
+    provider = GoogleTranslationProvider()
+    provider.max_concurrency = 2
+    provider.max_batch_size = 4
+    provider.is_available = AsyncMock(return_value=True)
+    provider.translate_batch = AsyncMock(side_effect=translate_batch)
+    strategy.providers = [provider]
+    texts = [f"Sentence {i}" for i in range(16)]
+    
+    results = await strategy.translate_batch_with_fallback(texts, "hi", "en")
+    
+    assert provider.translate_batch.call_count == 4
+    assert all(len(call.args[0]) == 4 for call in provider.translate_batch.call_args_list)
+    assert peak == 2
+    assert [result.translated_text for result in results] == [text.upper() for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_translation_strategy_caches_availability():
+    """Test that provider availability is probed once per TTL window, not per call"""
+    strategy = TranslationStrategy()
+    
+    provider = MagicMock()
+    provider.max_concurrency = 8
+    provider.get_provider_name.return_value = "nllb_200"
+    provider.is_available = AsyncMock(return_value=True)
+    provider.translate = AsyncMock(side_effect=lambda text, source, target: TranslationResult(
+        original_text=text,
+        translated_text=text,
+        source_language=source,
+        target_language=target,
+        confidence=0.75,
+        method="nllb_200"
+    ))
+    strategy.providers = [provider]
+    
+    for i in range(20):
+        await strategy.translate_with_fallback(f"Sentence {i}", "hi", "en")
+    
+    assert provider.translate.call_count == 20
+    assert provider.is_available.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_translation_strategy_hedges_slow_provider():
+    """Test that a slow provider is raced by the next one instead of waited out"""
+    strategy = TranslationStrategy()
+    cancelled = asyncio.Event()
+    
+    async def slow_translate(text, source, target):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    
+    async def fast_translate(text, source, target):
+        await asyncio.sleep(0.05)
+        return TranslationResult(
+            original_text=text,
+            translated_text="Hello world",
+            source_language=source,
+            target_language=target,
+            confidence=0.75,
+            method="nllb_200"
+        )
+    
+    provider1 = MagicMock()
+    provider1.max_concurrency = 50
+    provider1.get_provider_name.return_value = "google_translate"
+    provider1.is_available = AsyncMock(return_value=True)
+    provider1.translate = AsyncMock(side_effect=slow_translate)
+    
+    provider2 = MagicMock()
+    provider2.max_concurrency = 8
+    provider2.get_provider_name.return_value = "nllb_200"
+    provider2.is_available = AsyncMock(return_value=True)
+    provider2.translate = AsyncMock(side_effect=fast_translate)
+    
+    strategy.providers = [provider1, provider2]
+    
+    started = time.monotonic()
+    with patch.object(settings, "TRANSLATION_HEDGING_ENABLED", True), \
+         patch.object(settings, "TRANSLATION_HEDGE_DELAY_MS", 200):
+        result = await strategy.translate_with_fallback("नमस्ते दुनिया", "hi", "en")
+    elapsed = time.monotonic() - started
+    
+    assert result.method == "nllb_200"
+    assert elapsed < 0.5
+    assert provider1.translate.called
+    await asyncio.wait_for(cancelled.wait(), timeout=0.1)
+
+
 # HuggingFaceTranslator test - REMOVED for MVP (2-layer system)
 # @pytest.mark.asyncio
 # async def test_huggingface_translator_success():